@@ -0,0 +1,50 @@
+"""
+protext - Dynamic context management for AI agents
+
+In-process API for harnesses that call protext many times per process.
+The scripts/ CLIs are thin wrappers over these modules.
+
+    import protext
+    state = protext.load_state("/path/to/project")
+    protext.status("/path/to/project").code   # same flags as --check
+    protext.extract("/path/to/project", "network", budget=800).content
+
+Import with scripts/ on sys.path (e.g. PYTHONPATH=<skill>/scripts).
+
+Public names are resolved lazily so that importing a single submodule
+(as `protext_status.py --check` does with protext.state) stays cheap.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "extract": "api",
+    "init": "api",
+    "load": "api",
+    "load_state": "api",
+    "status": "api",
+    "ProtextExistsError": "bootstrap",
+    "ScopeNotFoundError": "loader",
+    "Extraction": "models",
+    "ExtractionEntry": "models",
+    "Handoff": "models",
+    "InitResult": "models",
+    "Load": "models",
+    "State": "models",
+    "Status": "models",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_EXPORTS[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
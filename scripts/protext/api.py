@@ -0,0 +1,140 @@
+"""
+protext.api - In-process entry points
+
+Functions here return typed objects (see protext.models) and never print
+or exit, so a long-lived process can call them repeatedly. Parsed YAML is
+cached per file until its mtime or size changes.
+"""
+
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+from . import bootstrap
+from . import extraction as _extract
+from . import loader as _load
+from .layers import LayerStack
+from .models import ExtractionEntry, Extraction, Handoff, InitResult, Load, State, Status
+from .state import (
+    check_status,
+    classify_handoff,
+    config_token_budget,
+    detect_tier,
+    estimate_protext_tokens_from_size,
+    get_handoff_ttl,
+    read_handoff_header,
+)
+
+PathLike = Union[str, Path]
+
+
+def _handoff(project_path: Path, ttl_hours: float) -> Handoff:
+    header = read_handoff_header(project_path)
+    if header is None:
+        return Handoff(exists=False)
+    info = classify_handoff(header, ttl_hours)
+    return Handoff(True, info["status"], info["updated"], info["age_hours"],
+                   project_path / ".protext" / "handoff.md")
+
+
+def load_state(path: PathLike) -> State:
+    """Read tier, config, scopes, handoff and extraction index.
+
+    path may be any directory inside a project; nested layers on its
+    ancestor chain are merged (see protext.layers).
+    """
+    stack = LayerStack(Path(path))
+    if stack.nearest is None:
+        return State(Path(path).resolve(), "none")
+
+    state = State(stack.nearest, detect_tier(stack.nearest), list(stack.layers))
+
+    state.config = stack.config()
+    handoff_path = stack.handoff_path()
+    if handoff_path is not None:
+        state.handoff = _handoff(handoff_path.parent.parent,
+                                 get_handoff_ttl(state.config))
+
+    if state.config:
+        state.active_scope = state.config.get("active_scope", "ops")
+        state.token_budget = config_token_budget(state.config)
+    state.scopes = sorted(stack.scopes())
+
+    for name, (layer, entry) in stack.extractions().items():
+        entry = entry if isinstance(entry, dict) else {}
+        triggers = entry.get("triggers") or []
+        sections = entry.get("sections") or []
+        state.extractions[name] = ExtractionEntry(
+            name=name,
+            source=entry.get("source"),
+            triggers=triggers if isinstance(triggers, list) else [triggers],
+            summary=entry.get("summary", ""),
+            tokens=str(entry["tokens"]) if "tokens" in entry else None,
+            sections=sections if isinstance(sections, list) else [sections],
+            layer=layer,
+        )
+
+    return state
+
+
+def status(path: PathLike) -> Status:
+    """Status summary without full file reads (handoff header, file sizes).
+
+    path may be any directory inside a project. The nearest layer sets the
+    tier; handoff, config, scopes and extractions follow the same layer
+    merge as load_state().
+    """
+    stack = LayerStack(Path(path))
+    project_path = stack.nearest or Path(path).resolve()
+    code, line = check_status(project_path, stack.layers)
+    tier = detect_tier(project_path)
+    result = Status(project_path, tier, code, line, list(stack.layers))
+    if tier == "none":
+        return result
+
+    config = stack.config()
+    handoff_path = stack.handoff_path()
+    if handoff_path is not None:
+        result.handoff = _handoff(handoff_path.parent.parent,
+                                  get_handoff_ttl(config))
+    result.protext_tokens = sum(
+        estimate_protext_tokens_from_size(layer) for layer in stack.layers
+    )
+
+    if config or tier == "advanced":
+        result.active_scope = config.get("active_scope", "ops")
+        result.token_budget = config_token_budget(config)
+        result.scope_count = len(stack.scopes())
+        result.extraction_count = len(stack.extractions())
+        result.cache = _extract.cache_stats(project_path)
+
+    return result
+
+
+def init(path: PathLike, tier: str = "advanced",
+         existing: Optional[str] = None) -> InitResult:
+    """Initialize protext. Raises bootstrap.ProtextExistsError on conflict."""
+    return bootstrap.init_protext(Path(path).resolve(), tier, existing)
+
+
+def extract(path: PathLike, name: str, budget: Optional[int] = None,
+            use_cache: bool = True) -> Extraction:
+    """Render an @deep: extraction from whichever layer defines name.
+
+    Raises KeyError for an unknown name.
+    """
+    stack = LayerStack(Path(path))
+    return _extract.extract(stack.owner(name), name, budget, use_cache,
+                            config=stack.config())
+
+
+def load(path: PathLike, scope: Optional[str] = None,
+         deep: Iterable[str] = (), minimal: bool = False,
+         dedup: bool = True) -> Load:
+    """Assemble /protext context.
+
+    Raises ScopeNotFoundError for a bad scope, KeyError for an
+    unknown extraction and FileNotFoundError for a missing source.
+    """
+    scope = scope.lstrip("@") if scope else None
+    return _load.load_context(Path(path).resolve(), scope, list(deep),
+                              minimal, dedup)
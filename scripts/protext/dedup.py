@@ -0,0 +1,198 @@
+"""
+protext.dedup - Duplicate paragraph detection for protext context
+
+Splits markdown into paragraphs. protext.loader emits a paragraph once
+(with a back-reference) only when a later copy says nothing new: its
+normalized words are identical to, or contained in, an earlier paragraph.
+One changed word ("Always" vs "Never") keeps both, since a scope caution
+that narrows or contradicts the root one must not disappear.
+
+protext.lint casts the wider net. It fingerprints paragraphs with MinHash
+signatures over word shingles and reports those whose estimated Jaccard
+similarity reaches a threshold, so near-duplicates can be reworded by hand.
+
+List items are compared one by one, since repeated cautions and key
+paths usually appear as single bullets. Headings and units shorter than
+MIN_WORDS are never treated as duplicates, so document structure is
+preserved.
+"""
+
+import hashlib
+import re
+
+SHINGLE_WORDS = 3
+NUM_HASHES = 64
+MIN_WORDS = 4
+DEFAULT_THRESHOLD = 0.8
+
+# Universal hashing parameters: h_i(x) = (a_i * x + b_i) mod MERSENNE_PRIME
+MERSENNE_PRIME = (1 << 61) - 1
+_PARAMS = [
+    (
+        int.from_bytes(hashlib.blake2b(f"a{i}".encode(), digest_size=8).digest(), "big")
+        % (MERSENNE_PRIME - 1) + 1,
+        int.from_bytes(hashlib.blake2b(f"b{i}".encode(), digest_size=8).digest(), "big")
+        % MERSENNE_PRIME,
+    )
+    for i in range(NUM_HASHES)
+]
+
+WORD_RE = re.compile(r"[a-z0-9][a-z0-9._/:-]*")
+LIST_ITEM_RE = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s+")
+
+
+def segments(content: str) -> list:
+    """Split markdown into (is_unit, text) pieces.
+
+    Units are paragraphs, single list items (with continuation lines) and
+    fenced code blocks. Blank lines and headings are structural pieces.
+    Joining every piece's text with newlines reproduces content exactly.
+    """
+    pieces = []
+    current = []
+    in_fence = False
+
+    def flush():
+        if current:
+            pieces.append((True, '\n'.join(current)))
+            current.clear()
+
+    for line in content.split('\n'):
+        if in_fence:
+            current.append(line)
+            if line.strip().startswith("```"):
+                in_fence = False
+                flush()
+        elif line.strip().startswith("```"):
+            flush()
+            current.append(line)
+            in_fence = True
+        elif not line.strip():
+            flush()
+            pieces.append((False, line))
+        elif line.lstrip().startswith('#'):
+            flush()
+            pieces.append((False, line))
+        elif LIST_ITEM_RE.match(line):
+            flush()
+            current.append(line)
+        else:
+            current.append(line)
+
+    flush()
+    return pieces
+
+
+def normalize(block: str) -> str:
+    """Lowercased words of a block, dropping markdown and sentence punctuation."""
+    return ' '.join(word.rstrip('._/:-') for word in WORD_RE.findall(block.lower()))
+
+
+def shingles(block: str) -> set:
+    """Word shingles of a block, lowercased with markdown punctuation dropped."""
+    words = WORD_RE.findall(block.lower())
+    if len(words) < MIN_WORDS:
+        return set()
+    return {
+        ' '.join(words[i:i + SHINGLE_WORDS])
+        for i in range(len(words) - SHINGLE_WORDS + 1)
+    }
+
+
+def minhash(shingle_set: set) -> tuple:
+    """MinHash signature of a shingle set (empty tuple for an empty set)."""
+    if not shingle_set:
+        return ()
+    hashed = [
+        int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "big")
+        for s in shingle_set
+    ]
+    return tuple(
+        min((a * h + b) % MERSENNE_PRIME for h in hashed)
+        for a, b in _PARAMS
+    )
+
+
+def similarity(sig_a: tuple, sig_b: tuple) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    if not sig_a or not sig_b:
+        return 0.0
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / NUM_HASHES
+
+
+class Deduplicator:
+    """Emits each repeated paragraph once across a sequence of documents.
+
+    Call dedupe() on each document in load order. A paragraph whose
+    normalized text equals, or is contained in, one already seen in an
+    earlier document (or earlier in the same one) is replaced with a
+    back-reference to where it first appeared. Paragraphs that merely look
+    similar are kept; `protext lint --duplicates` reports those.
+    """
+
+    def __init__(self):
+        self.seen = {}  # normalized text -> label
+        self.removed = 0
+        self.removed_chars = 0
+
+    def _match(self, text: str) -> str:
+        label = self.seen.get(text)
+        if label is not None:
+            return label
+        padded = f" {text} "
+        for seen_text, seen_label in self.seen.items():
+            if padded in f" {seen_text} ":
+                return seen_label
+        return None
+
+    def dedupe(self, label: str, content: str) -> str:
+        out = []
+        refs = None  # labels for the current run of dropped units
+
+        for is_unit, text in segments(content):
+            normalized = normalize(text) if is_unit else ""
+            if len(normalized.split()) < MIN_WORDS:
+                normalized = ""
+            first = self._match(normalized) if normalized else None
+
+            if first is None:
+                if normalized:
+                    self.seen.setdefault(normalized, label)
+                out.append(text)
+                refs = None
+                continue
+
+            self.removed += 1
+            self.removed_chars += len(text)
+            if refs is None:
+                refs = []
+                out.append(None)
+            if first not in refs:
+                refs.append(first)
+            out[-1] = f"> (duplicate content omitted - see {', '.join(refs)})"
+
+        return '\n'.join(out)
+
+
+def find_duplicates(documents: dict, threshold: float = DEFAULT_THRESHOLD) -> list:
+    """Group near-duplicate paragraphs across documents.
+
+    documents maps a label (e.g. a relative path) to markdown content.
+    Returns clusters as lists of (label, paragraph) with at least two
+    members, in first-seen order.
+    """
+    clusters = []  # [signature, [(label, block), ...]]
+
+    for label, content in documents.items():
+        for is_unit, unit in segments(content):
+            signature = minhash(shingles(unit)) if is_unit else ()
+            if not signature:
+                continue
+            for cluster in clusters:
+                if similarity(signature, cluster[0]) >= threshold:
+                    cluster[1].append((label, unit))
+                    break
+            else:
+                clusters.append([signature, [(label, unit)]])
+
+    return [members for _, members in clusters if len(members) > 1]
@@ -0,0 +1,278 @@
+"""
+protext.extraction - Render @deep: extractions with a size-bounded LRU cache
+
+Keeps only the index entry's sections: headings (if any), truncates to the
+token budget, and caches rendered payloads in .protext/.cache/ keyed by
+source hash and parameters.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+
+from .hashing import hash_file
+from .models import Extraction
+from .stats import record_event
+from .state import config_token_budget, load_yaml
+
+DEFAULT_CACHE_BYTES = 262144  # 256 KiB
+
+CACHE_DIR = Path(".protext") / ".cache"
+
+MANIFEST_NAME = "manifest.json"
+
+HEADING_RE = re.compile(r'^(#{1,6})\s+(.+?)\s*#*\s*$')
+
+TRUNCATED_NOTE = "[truncated to ~{budget} tokens]"
+
+
+def get_extractions(project_path: Path) -> dict:
+    """Return the extractions mapping from index.yaml."""
+    data = load_yaml(project_path / ".protext" / "index.yaml")
+    extractions = data.get("extractions", {})
+    return extractions if isinstance(extractions, dict) else {}
+
+
+def get_cache_limit(project_path: Path, config: dict = None) -> int:
+    """Get extraction cache byte cap from config (the project's own if None)."""
+    data = load_yaml(project_path / ".protext" / "config.yaml") if config is None else config
+    try:
+        return int(data.get("extraction_cache_bytes", DEFAULT_CACHE_BYTES))
+    except (ValueError, TypeError):
+        return DEFAULT_CACHE_BYTES
+
+
+def select_sections(content: str, sections: list) -> str:
+    """Keep only markdown sections whose heading matches one of sections.
+
+    A section runs from its heading to the next heading of the same or
+    higher level. Matching is case-insensitive on the heading text.
+    """
+    wanted = {s.strip().lower() for s in sections}
+    kept = []
+    keep_level = None
+
+    for line in content.split('\n'):
+        match = HEADING_RE.match(line)
+        if match:
+            level = len(match.group(1))
+            if keep_level is not None and level <= keep_level:
+                keep_level = None
+            if keep_level is None and match.group(2).strip().lower() in wanted:
+                keep_level = level
+        if keep_level is not None:
+            kept.append(line)
+
+    return '\n'.join(kept).strip() + '\n'
+
+
+def truncate_to_budget(content: str, budget: int) -> str:
+    """Truncate content at a line boundary to roughly budget tokens."""
+    max_chars = budget * 4  # ~4 chars per token
+    if budget <= 0 or len(content) <= max_chars:
+        return content
+
+    cut = content.rfind('\n', 0, max_chars)
+    if cut <= 0:
+        cut = max_chars
+    return content[:cut].rstrip() + "\n\n" + TRUNCATED_NOTE.format(budget=budget) + "\n"
+
+
+def render_extraction(source_path: Path, sections: list, budget: int) -> str:
+    """Read a source document and apply section selection and truncation."""
+    content = source_path.read_text()
+    if sections:
+        content = select_sections(content, sections)
+    return truncate_to_budget(content, budget)
+
+
+class ExtractionCache:
+    """Size-bounded LRU cache of rendered extractions under .protext/.cache/.
+
+    The manifest records each entry's size and last use, the stat signature
+    and hash of each source (so unchanged sources are not re-hashed), and
+    hit/miss/eviction counters.
+    """
+
+    def __init__(self, project_path: Path, max_bytes: int = None,
+                 config: dict = None):
+        self.project_path = project_path
+        self.cache_dir = project_path / CACHE_DIR
+        if max_bytes is None:
+            max_bytes = get_cache_limit(project_path, config)
+        self.max_bytes = max_bytes
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self) -> dict:
+        manifest = {"entries": {}, "sources": {}, "hits": 0, "misses": 0, "evictions": 0}
+        try:
+            manifest.update(json.loads((self.cache_dir / MANIFEST_NAME).read_text()))
+        except (OSError, ValueError):
+            pass
+        return manifest
+
+    def save(self) -> None:
+        """Write the manifest atomically.
+
+        Each writer uses its own temp file, so concurrent sessions can't
+        interleave writes; the last rename wins.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=str(self.cache_dir), prefix=MANIFEST_NAME,
+                                   suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(json.dumps(self.manifest, indent=1))
+            os.replace(tmp, str(self.cache_dir / MANIFEST_NAME))
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def source_hash(self, source: str) -> str:
+        """Hash of a source file, reused while its mtime and size are unchanged."""
+        stat = (self.project_path / source).stat()
+        signature = [stat.st_mtime, stat.st_size]
+        known = self.manifest["sources"].get(source)
+        if known and known["stat"] == signature:
+            return known["hash"]
+        digest = hash_file(self.project_path / source)
+        self.manifest["sources"][source] = {"stat": signature, "hash": digest}
+        return digest
+
+    @staticmethod
+    def make_key(source_hash: str, name: str, sections: list, budget: int) -> str:
+        params = json.dumps([source_hash, name, sections or [], budget])
+        return hashlib.sha256(params.encode()).hexdigest()[:32]
+
+    def get(self, key: str) -> str:
+        entry = self.manifest["entries"].get(key)
+        if entry is not None:
+            try:
+                payload = (self.cache_dir / f"{key}.md").read_text()
+            except OSError:
+                payload = None
+            if payload is not None:
+                entry["last_used"] = time.time()
+                self.manifest["hits"] += 1
+                return payload
+            del self.manifest["entries"][key]
+        self.manifest["misses"] += 1
+        return None
+
+    def put(self, key: str, payload: str) -> None:
+        size = len(payload.encode())
+        if size > self.max_bytes:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        (self.cache_dir / f"{key}.md").write_text(payload)
+        self.manifest["entries"][key] = {"size": size, "last_used": time.time()}
+        self._evict()
+
+    def total_bytes(self) -> int:
+        return sum(e["size"] for e in self.manifest["entries"].values())
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until under the byte cap.
+
+        Payload files the manifest doesn't list (left by a lost or reset
+        manifest) are deleted first, so the cap holds on disk too.
+        """
+        entries = self.manifest["entries"]
+        for path in self.cache_dir.glob("*.md"):
+            if path.stem not in entries:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+        total = self.total_bytes()
+        for key in sorted(entries, key=lambda k: entries[k]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            total -= entries[key]["size"]
+            del entries[key]
+            try:
+                (self.cache_dir / f"{key}.md").unlink()
+            except OSError:
+                pass
+            self.manifest["evictions"] += 1
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.manifest["hits"],
+            "misses": self.manifest["misses"],
+            "evictions": self.manifest["evictions"],
+            "entries": len(self.manifest["entries"]),
+            "bytes": self.total_bytes(),
+            "max_bytes": self.max_bytes,
+        }
+
+
+def cache_stats(project_path: Path) -> dict:
+    """Return extraction cache counters, or None if no cache exists yet."""
+    if not (project_path / CACHE_DIR / MANIFEST_NAME).exists():
+        return None
+    return ExtractionCache(project_path).stats()
+
+
+def extract(project_path: Path, name: str, budget: int = None,
+            use_cache: bool = True, in_load: bool = False,
+            config: dict = None) -> Extraction:
+    """Render the extraction called name.
+
+    Each call is recorded in the usage ledger (see protext.stats). in_load
+    marks extractions made for a load, whose load event already counts
+    their tokens. config is the effective (layer-merged) config supplying
+    token_budget, extraction_cache_bytes and features.usage_ledger; it
+    defaults to project_path's own config.
+    Raises KeyError if name is not in the index and FileNotFoundError if
+    its source is missing.
+    """
+    extractions = get_extractions(project_path)
+    if name not in extractions:
+        raise KeyError(name)
+
+    entry = extractions[name] if isinstance(extractions[name], dict) else {}
+    source = entry.get("source")
+    if not source or not (project_path / source).is_file():
+        raise FileNotFoundError(source or name)
+
+    if config is None:
+        config = load_yaml(project_path / ".protext" / "config.yaml")
+    if budget is None:
+        budget = config_token_budget(config)
+    sections = entry.get("sections") or []
+    if isinstance(sections, str):
+        sections = [sections]
+
+    cache_result = "off"
+    if not use_cache:
+        payload = render_extraction(project_path / source, sections, budget)
+    else:
+        cache = ExtractionCache(project_path, config=config)
+        key = cache.make_key(cache.source_hash(source), name, sections, budget)
+        payload = cache.get(key)
+        cache_result = "hit"
+        if payload is None:
+            payload = render_extraction(project_path / source, sections, budget)
+            cache.put(key, payload)
+            cache_result = "miss"
+        cache.save()
+
+    tokens = len(payload) // 4
+    truncated = payload.endswith(TRUNCATED_NOTE.format(budget=budget) + "\n")
+
+    fields = {"in_load": True} if in_load else {}
+    record_event(project_path, "extract", name, tokens, config=config,
+                 cache=cache_result, **fields)
+    if truncated:
+        record_event(project_path, "budget_hit", name, config=config,
+                     budget=budget)
+    return Extraction(name, source, payload, tokens, budget, cache_result, truncated)
@@ -0,0 +1,18 @@
+"""
+protext.hashing - Content hashes shared by the extraction cache and registry
+
+Kept out of protext.state so the --check hook path doesn't import hashlib,
+and out of protext.registry so rendering doesn't import sqlite3.
+"""
+
+import hashlib
+from pathlib import Path
+
+
+def hash_file(path: Path) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
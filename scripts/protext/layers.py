@@ -0,0 +1,131 @@
+"""
+protext.layers - Nested protext layers for monorepos
+
+A layer is any directory with its own PROTEXT.md (and optionally .protext/).
+Loading from a working directory resolves only the layers on its ancestor
+chain, up to the repository root (the first directory containing .git) or a
+layer whose config.yaml sets `inherit: false`. Sibling packages are never
+read.
+
+Merge rules, nearest layer wins:
+- config.yaml: keys override; the features mapping merges key by key
+- index.yaml: extractions merge by name; sources stay relative to the layer
+  that defines them
+- scopes/: scope files merge by name
+- handoff.md: the nearest layer that has one
+
+The 20-extraction / 5-scope limits apply to each layer, not the merged view.
+Merged views are computed on first use, so a caller that only needs the
+handoff never parses any index.
+"""
+
+from pathlib import Path
+
+from .state import load_yaml, parse_yaml_simple
+
+
+def _inherits(layer: Path) -> bool:
+    """False if the layer's config.yaml sets inherit: false.
+
+    Uses the simple parser: discovery runs on the --check hook path, which
+    must not pay for importing PyYAML.
+    """
+    try:
+        content = (layer / ".protext" / "config.yaml").read_text()
+    except OSError:
+        return True
+    config = parse_yaml_simple(content)
+    return str(config.get("inherit", True)).lower() not in ("false", "no", "0")
+
+
+def find_layers(start: Path) -> list:
+    """Layer directories on the ancestor chain of start, outermost first."""
+    current = start.resolve()
+    if current.is_file():
+        current = current.parent
+
+    layers = []
+    for directory in [current, *current.parents]:
+        if (directory / "PROTEXT.md").exists():
+            layers.append(directory)
+            if not _inherits(directory):
+                break
+        if (directory / ".git").exists():
+            break
+
+    layers.reverse()
+    return layers
+
+
+class LayerStack:
+    """Merged view over the layers that apply to a working directory."""
+
+    def __init__(self, start: Path):
+        self.layers = find_layers(start)
+        self._config = None
+        self._extractions = None
+        self._scopes = None
+
+    @property
+    def nearest(self) -> Path:
+        """Innermost layer, or None if no layer applies."""
+        return self.layers[-1] if self.layers else None
+
+    @property
+    def root(self) -> Path:
+        """Outermost layer, or None if no layer applies."""
+        return self.layers[0] if self.layers else None
+
+    def relative(self, path: Path) -> str:
+        """Display path for a layer file, relative to the root layer."""
+        return str(path.relative_to(self.root))
+
+    def config(self) -> dict:
+        if self._config is None:
+            merged = {}
+            for layer in self.layers:
+                data = load_yaml(layer / ".protext" / "config.yaml")
+                for key, value in data.items():
+                    if isinstance(value, dict) and isinstance(merged.get(key), dict):
+                        merged[key].update(value)
+                    else:
+                        merged[key] = value
+            self._config = merged
+        return self._config
+
+    def extractions(self) -> dict:
+        """Map name -> (owning layer, index entry)."""
+        if self._extractions is None:
+            merged = {}
+            for layer in self.layers:
+                data = load_yaml(layer / ".protext" / "index.yaml")
+                entries = data.get("extractions") or {}
+                if isinstance(entries, dict):
+                    for name, entry in entries.items():
+                        merged[str(name)] = (layer, entry)
+            self._extractions = merged
+        return self._extractions
+
+    def scopes(self) -> dict:
+        """Map scope name -> scope file path."""
+        if self._scopes is None:
+            merged = {}
+            for layer in self.layers:
+                scopes_dir = layer / ".protext" / "scopes"
+                if scopes_dir.is_dir():
+                    for scope_file in sorted(scopes_dir.glob("*.md")):
+                        merged[scope_file.stem] = scope_file
+            self._scopes = merged
+        return self._scopes
+
+    def handoff_path(self) -> Path:
+        """Handoff file of the nearest layer that has one."""
+        for layer in reversed(self.layers):
+            path = layer / ".protext" / "handoff.md"
+            if path.exists():
+                return path
+        return None
+
+    def owner(self, name: str) -> Path:
+        """Layer defining extraction name. Raises KeyError if none does."""
+        return self.extractions()[name][0]
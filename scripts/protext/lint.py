@@ -0,0 +1,37 @@
+"""
+protext.lint - Checks over protext content
+"""
+
+from pathlib import Path
+
+from .layers import LayerStack
+
+
+def gather_documents(start: Path) -> dict:
+    """Map path -> content for every document a load from start can include.
+
+    Follows the same layer merge as protext.loader: every layer's
+    PROTEXT.md, the nearest handoff, the merged scopes and extraction
+    sources. Labels are relative to the root layer.
+    """
+    stack = LayerStack(start)
+    if stack.nearest is None:
+        return {}
+
+    paths = [layer / "PROTEXT.md" for layer in stack.layers]
+
+    handoff_path = stack.handoff_path()
+    if handoff_path is not None:
+        paths.append(handoff_path)
+
+    paths.extend(path for _, path in sorted(stack.scopes().items()))
+
+    for layer, entry in stack.extractions().values():
+        if isinstance(entry, dict) and entry.get("source"):
+            paths.append(layer / entry["source"])
+
+    documents = {}
+    for path in paths:
+        if path.is_file():
+            documents.setdefault(stack.relative(path), path.read_text())
+    return documents
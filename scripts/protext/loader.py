@@ -0,0 +1,93 @@
+"""
+protext.loader - Assemble /protext orientation context
+
+Concatenates PROTEXT.md, the session handoff, the scope file and requested
+@deep: extractions, emitting repeated paragraphs once (see protext.dedup).
+In a monorepo, every PROTEXT.md on the ancestor chain is included (outermost
+first) and scopes, extractions and config merge per protext.layers.
+"""
+
+from pathlib import Path
+
+from .dedup import Deduplicator
+from .extraction import extract
+from .layers import LayerStack
+from .models import Load
+from .stats import record_event
+
+
+class ScopeNotFoundError(FileNotFoundError):
+    """No layer defines the requested scope file."""
+
+    def __init__(self, scope: str):
+        super().__init__(f"Scope not found: {scope}")
+        self.scope = scope
+
+
+def collect_parts(stack: LayerStack, scope: str = None, deep: list = None,
+                  minimal: bool = False) -> list:
+    """Return (label, content) pairs selected for a load, in load order.
+
+    Raises ScopeNotFoundError for a missing scope file, KeyError for an
+    unknown extraction and FileNotFoundError for a missing extraction
+    source.
+    """
+    parts = [
+        (stack.relative(layer / "PROTEXT.md"), (layer / "PROTEXT.md").read_text())
+        for layer in stack.layers
+    ]
+    if minimal:
+        return parts
+
+    handoff_path = stack.handoff_path()
+    if handoff_path is not None:
+        parts.append((stack.relative(handoff_path), handoff_path.read_text()))
+
+    config = stack.config()
+    if scope is None and config:
+        scope = config.get("active_scope", "ops")
+    if scope:
+        scope_path = stack.scopes().get(scope)
+        if scope_path is None:
+            raise ScopeNotFoundError(scope)
+        parts.append((stack.relative(scope_path), scope_path.read_text()))
+
+    for name in deep or []:
+        extraction = extract(stack.owner(name), name, in_load=True,
+                             config=config)
+        parts.append((f"@deep:{name}", extraction.content))
+
+    return parts
+
+
+def render_load(parts: list, dedup: bool = True) -> tuple:
+    """Join parts under labelled dividers. Returns (text, tokens saved)."""
+    deduplicator = Deduplicator() if dedup else None
+    chunks = []
+
+    for label, content in parts:
+        if deduplicator is not None:
+            content = deduplicator.dedupe(label, content)
+        chunks.append(f"<!-- {label} -->\n{content.rstrip()}\n")
+
+    saved = deduplicator.removed_chars // 4 if deduplicator else 0
+    return '\n'.join(chunks), saved
+
+
+def load_context(start: Path, scope: str = None, deep: list = None,
+                 minimal: bool = False, dedup: bool = True) -> Load:
+    """Collect, render and record a load in the usage ledger.
+
+    start is the working directory; the nearest layer records the load.
+    Raises FileNotFoundError if no protext layer applies to start.
+    """
+    stack = LayerStack(start)
+    if stack.nearest is None:
+        raise FileNotFoundError(f"Protext not initialized: {start}")
+
+    parts = collect_parts(stack, scope, deep, minimal)
+    text, saved = render_load(parts, dedup)
+    tokens = len(text) // 4
+    record_event(stack.nearest, "load", tokens=tokens, config=stack.config(),
+                 dedup_saved=saved)
+    return Load(text, [label for label, _ in parts], tokens, saved)
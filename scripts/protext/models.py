@@ -0,0 +1,105 @@
+"""
+protext.models - Typed results returned by the protext API
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+@dataclass
+class Handoff:
+    """Session handoff freshness."""
+    exists: bool
+    status: str = "UNKNOWN"
+    updated: Optional[datetime] = None
+    age_hours: Optional[float] = None
+    path: Optional[Path] = None  # handoff.md, possibly in an ancestor layer
+
+
+@dataclass
+class ExtractionEntry:
+    """One extraction as declared in .protext/index.yaml."""
+    name: str
+    source: Optional[str] = None
+    triggers: List[str] = field(default_factory=list)
+    summary: str = ""
+    tokens: Optional[str] = None
+    sections: List[str] = field(default_factory=list)
+    layer: Optional[Path] = None  # directory whose index defines it
+
+
+@dataclass
+class State:
+    """Everything protext knows about a project, without rendering it.
+
+    path is the nearest layer; layers lists every layer that applies,
+    outermost first, and config/scopes/extractions are their merged view.
+    """
+    path: Path
+    tier: str
+    layers: List[Path] = field(default_factory=list)
+    active_scope: Optional[str] = None
+    scopes: List[str] = field(default_factory=list)
+    handoff: Handoff = field(default_factory=lambda: Handoff(exists=False))
+    token_budget: int = 2000
+    config: dict = field(default_factory=dict)
+    extractions: Dict[str, ExtractionEntry] = field(default_factory=dict)
+
+
+@dataclass
+class Status:
+    """Summary used by status reports and hooks.
+
+    code holds the same bit flags as `protext_status.py --check`. path is
+    the nearest layer and layers every layer that applies, outermost first.
+    active_scope is None when no layer has a config.yaml.
+    """
+    path: Path
+    tier: str
+    code: int
+    line: str
+    layers: List[Path] = field(default_factory=list)
+    active_scope: Optional[str] = None
+    scope_count: int = 0
+    handoff: Handoff = field(default_factory=lambda: Handoff(exists=False))
+    token_budget: int = 2000
+    protext_tokens: int = 0
+    extraction_count: int = 0
+    cache: Optional[dict] = None
+
+
+@dataclass
+class InitResult:
+    """Files written by an init or update run."""
+    path: Path
+    tier: str
+    mode: str  # init | archive | replace | update
+    name: str
+    docs_found: int = 0
+    created: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    preserved: List[str] = field(default_factory=list)
+    archived_to: Optional[Path] = None
+
+
+@dataclass
+class Extraction:
+    """A rendered @deep: extraction."""
+    name: str
+    source: str
+    content: str
+    tokens: int
+    budget: int
+    cache: str  # hit | miss | off
+    truncated: bool = False
+
+
+@dataclass
+class Load:
+    """Assembled /protext context."""
+    text: str
+    parts: List[str]
+    tokens: int
+    dedup_saved: int = 0
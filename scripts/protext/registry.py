@@ -0,0 +1,391 @@
+"""
+protext.registry - SQLite fleet registry of protext projects
+
+Stores per-project tier, scope, handoff, token usage and extraction source
+hashes so fleet-wide questions are answered by SQL lookups. Refresh is
+incremental by file mtime; see scripts/protext_registry.py for the CLI.
+"""
+
+import csv
+import json
+import os
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+from .hashing import hash_file
+from .state import (
+    DEFAULT_HANDOFF_TTL_HOURS,
+    classify_handoff,
+    config_token_budget,
+    count_scopes,
+    detect_tier,
+    estimate_protext_tokens_from_size,
+    get_handoff_ttl,
+    load_yaml,
+    read_handoff_header,
+)
+
+DEFAULT_REGISTRY = Path.home() / ".protext" / "registry.db"
+
+# Directories never descended into when discovering projects
+SKIP_DIRS = {".git", ".protext", "node_modules", ".venv", "venv", "__pycache__"}
+
+# Files whose mtime marks a project as changed
+WATCHED_FILES = (
+    "PROTEXT.md",
+    ".protext/handoff.md",
+    ".protext/config.yaml",
+    ".protext/index.yaml",
+    ".protext/scopes",
+)
+
+# Handoff status, computed when read so it never goes stale between
+# refreshes. As in classify_handoff(), age against the project's TTL can
+# escalate past an explicit Status: (a template's FRESH), never the reverse.
+_HANDOFF_AGE_SQL = "(julianday('now', 'localtime') - julianday(handoff_updated)) * 24"
+_HANDOFF_TTL_SQL = f"COALESCE(handoff_ttl_hours, {DEFAULT_HANDOFF_TTL_HOURS})"
+HANDOFF_STATUS_SQL = f"""CASE
+    WHEN handoff_updated IS NULL THEN COALESCE(handoff_explicit, 'UNKNOWN')
+    WHEN handoff_explicit = 'STALE' OR {_HANDOFF_AGE_SQL} >= {_HANDOFF_TTL_SQL}
+        THEN 'STALE'
+    WHEN handoff_explicit = 'AGING' OR {_HANDOFF_AGE_SQL} >= {_HANDOFF_TTL_SQL} / 2.0
+        THEN 'AGING'
+    ELSE 'FRESH'
+END"""
+
+# Bumped when VIEW_SQL or columns change; connect() migrates older files
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    path              TEXT PRIMARY KEY,
+    name              TEXT NOT NULL,
+    tier              TEXT NOT NULL,
+    active_scope      TEXT,
+    handoff_updated   TEXT,
+    handoff_explicit  TEXT,
+    handoff_ttl_hours REAL,
+    token_budget      INTEGER,
+    protext_tokens    INTEGER,
+    scope_count       INTEGER,
+    extraction_count  INTEGER,
+    files_mtime       REAL NOT NULL,
+    refreshed_at      TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS extractions (
+    project_path   TEXT NOT NULL REFERENCES projects(path) ON DELETE CASCADE,
+    name           TEXT NOT NULL,
+    source         TEXT,
+    source_hash    TEXT,
+    source_mtime   REAL,
+    PRIMARY KEY (project_path, name)
+);
+
+CREATE INDEX IF NOT EXISTS idx_projects_scope_handoff
+    ON projects (active_scope, handoff_updated);
+CREATE INDEX IF NOT EXISTS idx_projects_tier ON projects (tier);
+CREATE INDEX IF NOT EXISTS idx_extractions_name ON extractions (name);
+"""
+
+VIEW_SQL = f"""
+DROP VIEW IF EXISTS project_status;
+CREATE VIEW project_status AS
+SELECT path, name, tier, active_scope, handoff_updated, handoff_explicit,
+       {HANDOFF_STATUS_SQL} AS handoff_status,
+       token_budget, protext_tokens, scope_count, extraction_count,
+       files_mtime, refreshed_at
+FROM projects;
+"""
+
+EXPORT_COLUMNS = (
+    "path", "name", "tier", "active_scope", "handoff_updated",
+    "handoff_status", "token_budget", "protext_tokens", "scope_count",
+    "extraction_count", "refreshed_at",
+)
+
+
+def registry_path(db: Path = None) -> Path:
+    """Resolve the registry database path."""
+    if db is not None:
+        return db
+    env = os.environ.get("PROTEXT_REGISTRY")
+    if env:
+        return Path(env).expanduser()
+    return DEFAULT_REGISTRY
+
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    """Open (and create if needed) the registry database."""
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path))
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(SCHEMA)
+    if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+        _migrate(conn)
+    return conn
+
+
+def _migrate(conn: sqlite3.Connection) -> None:
+    """Bring a registry created by an older version up to SCHEMA_VERSION."""
+    columns = {row["name"] for row in conn.execute("PRAGMA table_info(projects)")}
+    if "handoff_ttl_hours" not in columns:
+        conn.execute("ALTER TABLE projects ADD COLUMN handoff_ttl_hours REAL")
+    conn.executescript(VIEW_SQL + f"PRAGMA user_version = {SCHEMA_VERSION};")
+
+
+def files_mtime(project_path: Path) -> float:
+    """Newest mtime across the project's protext files (0 if none)."""
+    newest = 0.0
+    for rel in WATCHED_FILES:
+        try:
+            newest = max(newest, (project_path / rel).stat().st_mtime)
+        except OSError:
+            continue
+    return newest
+
+
+def _read_index(project_path: Path) -> dict:
+    """Return the extractions mapping from index.yaml."""
+    data = load_yaml(project_path / ".protext" / "index.yaml")
+    extractions = data.get("extractions", {})
+    return extractions if isinstance(extractions, dict) else {}
+
+
+def _sources_changed(conn: sqlite3.Connection, project_path: Path) -> bool:
+    """True if any recorded extraction source has a different mtime."""
+    for row in conn.execute(
+        "SELECT source, source_mtime FROM extractions "
+        "WHERE project_path = ? AND source IS NOT NULL", (str(project_path),)
+    ):
+        try:
+            mtime = (project_path / row["source"]).stat().st_mtime
+        except OSError:
+            mtime = None
+        if mtime != row["source_mtime"]:
+            return True
+    return False
+
+
+def _record_extractions(conn: sqlite3.Connection, project_path: Path) -> int:
+    """Sync the extractions table for a project, re-hashing changed sources."""
+    key = str(project_path)
+    known = {
+        row["name"]: row
+        for row in conn.execute(
+            "SELECT name, source, source_hash, source_mtime "
+            "FROM extractions WHERE project_path = ?", (key,)
+        )
+    }
+
+    extractions = _read_index(project_path)
+    for name, entry in extractions.items():
+        source = entry.get("source") if isinstance(entry, dict) else None
+        source_hash = None
+        source_mtime = None
+
+        if source:
+            source_path = project_path / source
+            try:
+                source_mtime = source_path.stat().st_mtime
+            except OSError:
+                source_mtime = None
+
+            previous = known.get(name)
+            if (previous is not None and previous["source"] == source
+                    and previous["source_mtime"] == source_mtime):
+                source_hash = previous["source_hash"]
+            elif source_mtime is not None:
+                source_hash = hash_file(source_path)
+
+        conn.execute(
+            "INSERT OR REPLACE INTO extractions "
+            "(project_path, name, source, source_hash, source_mtime) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (key, str(name), source, source_hash, source_mtime),
+        )
+
+    stale = set(known) - {str(name) for name in extractions}
+    conn.executemany(
+        "DELETE FROM extractions WHERE project_path = ? AND name = ?",
+        [(key, name) for name in stale],
+    )
+    return len(extractions)
+
+
+def record_project(conn: sqlite3.Connection, project_path: Path,
+                   force: bool = False) -> bool:
+    """Record one project's state. Returns True if the row was (re)written.
+
+    Skips the project when its protext files are unchanged since the last
+    refresh, unless force is set. Projects without PROTEXT.md are removed.
+    """
+    project_path = project_path.resolve()
+    key = str(project_path)
+    tier = detect_tier(project_path)
+
+    if tier == "none":
+        conn.execute("DELETE FROM projects WHERE path = ?", (key,))
+        return False
+
+    mtime = files_mtime(project_path)
+    row = conn.execute(
+        "SELECT files_mtime FROM projects WHERE path = ?", (key,)
+    ).fetchone()
+    if (row is not None and not force and row["files_mtime"] >= mtime
+            and not _sources_changed(conn, project_path)):
+        return False
+
+    active_scope = None
+    token_budget = None
+    protext_tokens = estimate_protext_tokens_from_size(project_path)
+    handoff_updated = None
+    handoff_explicit = None
+    config = {}
+
+    if tier == "advanced":
+        config = load_yaml(project_path / ".protext" / "config.yaml")
+        active_scope = config.get("active_scope", "ops")
+        token_budget = config_token_budget(config)
+
+    if tier in ("intermediate", "advanced"):
+        header = read_handoff_header(project_path)
+        if header is not None:
+            handoff = classify_handoff(header)
+            if handoff["updated"] is not None:
+                handoff_updated = handoff["updated"].isoformat(timespec="minutes")
+            handoff_explicit = handoff["explicit_status"]
+
+    # Upsert rather than REPLACE so the extractions rows (and their cached
+    # source hashes) are not cascaded away.
+    conn.execute(
+        "INSERT INTO projects "
+        "(path, name, tier, active_scope, handoff_updated, handoff_explicit, "
+        " handoff_ttl_hours, token_budget, protext_tokens, scope_count, "
+        " extraction_count, files_mtime, refreshed_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0, ?, ?) "
+        "ON CONFLICT(path) DO UPDATE SET "
+        " name = excluded.name, tier = excluded.tier, "
+        " active_scope = excluded.active_scope, "
+        " handoff_updated = excluded.handoff_updated, "
+        " handoff_explicit = excluded.handoff_explicit, "
+        " handoff_ttl_hours = excluded.handoff_ttl_hours, "
+        " token_budget = excluded.token_budget, "
+        " protext_tokens = excluded.protext_tokens, "
+        " scope_count = excluded.scope_count, "
+        " files_mtime = excluded.files_mtime, "
+        " refreshed_at = excluded.refreshed_at",
+        (
+            key, project_path.name, tier, active_scope, handoff_updated,
+            handoff_explicit, get_handoff_ttl(config), token_budget, protext_tokens,
+            count_scopes(project_path), mtime,
+            datetime.now().isoformat(timespec="seconds"),
+        ),
+    )
+
+    extraction_count = 0
+    if tier == "advanced":
+        extraction_count = _record_extractions(conn, project_path)
+    else:
+        conn.execute("DELETE FROM extractions WHERE project_path = ?", (key,))
+    conn.execute(
+        "UPDATE projects SET extraction_count = ? WHERE path = ?",
+        (extraction_count, key),
+    )
+    return True
+
+
+def update_registry(project_path: Path, db: Path = None) -> None:
+    """Record a single project; used by the status and init scripts."""
+    conn = connect(registry_path(db))
+    try:
+        with conn:
+            record_project(conn, project_path, force=True)
+    finally:
+        conn.close()
+
+
+def discover_projects(root: Path):
+    """Yield directories under root that contain a PROTEXT.md."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        if "PROTEXT.md" in filenames:
+            yield Path(dirpath)
+
+
+def refresh(conn: sqlite3.Connection, roots: list = None) -> dict:
+    """Incrementally refresh registered projects and any found under roots."""
+    counts = {"scanned": 0, "updated": 0, "removed": 0}
+
+    paths = {Path(row["path"]) for row in conn.execute("SELECT path FROM projects")}
+    for root in roots or []:
+        paths.update(discover_projects(root.resolve()))
+
+    with conn:
+        for project_path in sorted(paths):
+            counts["scanned"] += 1
+            if not (project_path / "PROTEXT.md").exists():
+                conn.execute("DELETE FROM projects WHERE path = ?", (str(project_path),))
+                counts["removed"] += 1
+                continue
+            if record_project(conn, project_path):
+                counts["updated"] += 1
+
+    return counts
+
+
+def query(conn: sqlite3.Connection, status: str = None, scope: str = None,
+          tier: str = None, extraction: str = None,
+          over_budget: bool = False) -> list:
+    """Return project rows matching all given filters (read-only)."""
+    clauses = []
+    params = []
+
+    if status:
+        clauses.append("handoff_status = ?")
+        params.append(status.upper())
+    if scope:
+        clauses.append("active_scope = ?")
+        params.append(scope.lstrip("@"))
+    if tier:
+        clauses.append("tier = ?")
+        params.append(tier)
+    if extraction:
+        clauses.append(
+            "path IN (SELECT project_path FROM extractions WHERE name = ?)"
+        )
+        params.append(extraction)
+    if over_budget:
+        clauses.append("token_budget > 0 AND protext_tokens > token_budget")
+
+    sql = "SELECT * FROM project_status"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += " ORDER BY path"
+    return [dict(row) for row in conn.execute(sql, params)]
+
+
+def export(conn: sqlite3.Connection, fmt: str, out) -> None:
+    """Write all projects (with their extractions for json) to out."""
+    rows = [
+        {col: row[col] for col in EXPORT_COLUMNS}
+        for row in conn.execute("SELECT * FROM project_status ORDER BY path")
+    ]
+
+    if fmt == "csv":
+        writer = csv.DictWriter(out, fieldnames=EXPORT_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+        return
+
+    for row in rows:
+        row["extractions"] = [
+            dict(ext) for ext in conn.execute(
+                "SELECT name, source, source_hash FROM extractions "
+                "WHERE project_path = ? ORDER BY name", (row["path"],)
+            )
+        ]
+    json.dump(rows, out, indent=2)
+    out.write("\n")
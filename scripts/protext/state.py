@@ -0,0 +1,336 @@
+"""
+protext.state - Read protext state from a project directory
+
+Tier detection, handoff freshness, scope/extraction counts, token budget
+estimates and the fast header-only check used by hooks.
+"""
+
+import copy
+import re
+from datetime import datetime
+from pathlib import Path
+
+# Bytes of handoff.md read in --check mode (header is on the first lines)
+HANDOFF_HEADER_BYTES = 512
+
+# --check exit code flags (combined with bitwise OR)
+CHECK_OK = 0
+CHECK_NOT_INITIALIZED = 4
+CHECK_HANDOFF_STALE = 8
+CHECK_BUDGET_EXCEEDED = 16
+
+# Handoff statuses, least to most severe
+HANDOFF_STATUSES = ("FRESH", "AGING", "STALE")
+
+DEFAULT_HANDOFF_TTL_HOURS = 48
+
+DEFAULT_TOKEN_BUDGET = 2000
+
+
+def parse_yaml_simple(content: str) -> dict:
+    """Simple YAML parser for basic key-value extraction."""
+    result = {}
+    current_section = None
+
+    for line in content.split('\n'):
+        # Skip comments and empty lines
+        if line.strip().startswith('#') or not line.strip():
+            continue
+
+        # Check for top-level key
+        if not line.startswith(' ') and ':' in line:
+            key, _, value = line.partition(':')
+            key = key.strip()
+            value = value.split(' #', 1)[0].strip()
+            if value:
+                result[key] = value
+            else:
+                result[key] = {}
+                current_section = key
+        elif current_section and line.startswith('  ') and ':' in line:
+            key, _, value = line.partition(':')
+            key = key.strip()
+            value = value.split(' #', 1)[0].strip()
+            if isinstance(result[current_section], dict):
+                result[current_section][key] = value
+
+    return result
+
+
+# Parsed YAML keyed by path, reused while (mtime, size) is unchanged so
+# long-lived processes using the protext API don't re-parse on every call.
+_YAML_CACHE = {}
+
+
+def load_yaml(path: Path) -> dict:
+    """Load YAML file with fallback to simple parser."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return {}
+
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _YAML_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        return copy.deepcopy(cached[1])
+
+    content = path.read_text()
+    data = None
+
+    # Imported here: PyYAML dominates startup and the --check path never
+    # needs it (it uses parse_yaml_simple).
+    try:
+        import yaml
+    except ImportError:
+        yaml = None
+
+    if yaml is not None:
+        try:
+            data = yaml.safe_load(content) or {}
+        except yaml.YAMLError:
+            pass
+
+    if data is None:
+        data = parse_yaml_simple(content)
+
+    _YAML_CACHE[path] = (signature, data)
+    return copy.deepcopy(data)
+
+
+def detect_tier(project_path: Path) -> str:
+    """Detect the protext tier based on existing files."""
+    protext_md = project_path / "PROTEXT.md"
+    protext_dir = project_path / ".protext"
+    handoff_md = protext_dir / "handoff.md"
+    index_yaml = protext_dir / "index.yaml"
+
+    if not protext_md.exists():
+        return "none"
+    if not protext_dir.exists():
+        return "beginner"
+    if not index_yaml.exists():
+        return "intermediate"
+    return "advanced"
+
+
+def get_handoff_ttl(config: dict) -> float:
+    """handoff_ttl_hours from a parsed config, falling back to the default."""
+    try:
+        ttl = float(config.get("handoff_ttl_hours", DEFAULT_HANDOFF_TTL_HOURS))
+    except (ValueError, TypeError):
+        return DEFAULT_HANDOFF_TTL_HOURS
+    return ttl if ttl > 0 else DEFAULT_HANDOFF_TTL_HOURS
+
+
+def classify_handoff(header: str,
+                     ttl_hours: float = DEFAULT_HANDOFF_TTL_HOURS) -> dict:
+    """Derive handoff timestamp, age and status from handoff header text.
+
+    Age gives FRESH under half the TTL, AGING under the TTL and STALE past
+    it. An explicit Status: in the header can only make the result more
+    severe, so a template's "Status: FRESH" never hides an old timestamp.
+    """
+    result = {
+        "updated": None,
+        "status": "UNKNOWN",
+        "explicit_status": None,
+        "age_hours": None,
+    }
+
+    # Extract timestamp from header
+    # Format: > Updated: YYYY-MM-DDTHH:MM | TTL: 48h | Status: FRESH
+    header_match = re.search(
+        r'Updated:\s*(\d{4}-\d{2}-\d{2}T\d{2}:\d{2})',
+        header
+    )
+
+    if header_match:
+        try:
+            updated = datetime.fromisoformat(header_match.group(1))
+            result["updated"] = updated
+            age = datetime.now() - updated
+            result["age_hours"] = age.total_seconds() / 3600
+
+            if result["age_hours"] < ttl_hours / 2:
+                result["status"] = "FRESH"
+            elif result["age_hours"] < ttl_hours:
+                result["status"] = "AGING"
+            else:
+                result["status"] = "STALE"
+        except ValueError:
+            pass
+
+    # Check for explicit status in header
+    status_match = re.search(r'Status:\s*(\w+)', header)
+    if status_match:
+        explicit_status = status_match.group(1).upper()
+        if explicit_status in HANDOFF_STATUSES:
+            result["explicit_status"] = explicit_status
+            if (result["status"] not in HANDOFF_STATUSES
+                    or HANDOFF_STATUSES.index(explicit_status)
+                    > HANDOFF_STATUSES.index(result["status"])):
+                result["status"] = explicit_status
+
+    return result
+
+
+def parse_handoff_status(project_path: Path, ttl_hours: float = None) -> dict:
+    """Parse handoff.md for status information.
+
+    ttl_hours defaults to handoff_ttl_hours in the project's config.
+    """
+    handoff_path = project_path / ".protext" / "handoff.md"
+
+    if not handoff_path.exists():
+        return {
+            "exists": False,
+            "updated": None,
+            "status": "UNKNOWN",
+            "explicit_status": None,
+            "age_hours": None,
+        }
+
+    if ttl_hours is None:
+        ttl_hours = get_handoff_ttl(load_yaml(project_path / ".protext" / "config.yaml"))
+    result = {"exists": True}
+    result.update(classify_handoff(handoff_path.read_text(), ttl_hours))
+    return result
+
+
+def read_handoff_header(project_path: Path) -> str:
+    """Read only the leading bytes of handoff.md, where the header lives."""
+    handoff_path = project_path / ".protext" / "handoff.md"
+
+    try:
+        with handoff_path.open("rb") as f:
+            head = f.read(HANDOFF_HEADER_BYTES)
+    except OSError:
+        return None
+
+    return head.decode("utf-8", errors="ignore")
+
+
+def count_extractions(project_path: Path) -> int:
+    """Count extractions in index.yaml."""
+    index_path = project_path / ".protext" / "index.yaml"
+
+    if not index_path.exists():
+        return 0
+
+    data = load_yaml(index_path)
+    extractions = data.get("extractions", {})
+
+    if isinstance(extractions, dict):
+        return len(extractions)
+    return 0
+
+
+def count_scopes(project_path: Path) -> int:
+    """Count scope files."""
+    scopes_dir = project_path / ".protext" / "scopes"
+
+    if not scopes_dir.exists():
+        return 0
+
+    return len(list(scopes_dir.glob("*.md")))
+
+
+def get_active_scope(project_path: Path) -> str:
+    """Get active scope from config."""
+    config_path = project_path / ".protext" / "config.yaml"
+
+    if not config_path.exists():
+        return "none"
+
+    data = load_yaml(config_path)
+    return data.get("active_scope", "ops")
+
+
+def config_token_budget(config: dict) -> int:
+    """token_budget from a parsed config, falling back to the default."""
+    try:
+        return int(config.get("token_budget", DEFAULT_TOKEN_BUDGET))
+    except (ValueError, TypeError):
+        return DEFAULT_TOKEN_BUDGET
+
+
+def get_token_budget(project_path: Path) -> int:
+    """Get token budget from config."""
+    return config_token_budget(load_yaml(project_path / ".protext" / "config.yaml"))
+
+
+def estimate_protext_tokens(project_path: Path) -> int:
+    """Rough estimate of PROTEXT.md token count."""
+    protext_md = project_path / "PROTEXT.md"
+
+    if not protext_md.exists():
+        return 0
+
+    content = protext_md.read_text()
+    # Rough estimate: ~4 chars per token
+    return len(content) // 4
+
+
+def estimate_protext_tokens_from_size(project_path: Path) -> int:
+    """Estimate PROTEXT.md token count from its on-disk size (no read)."""
+    try:
+        size = (project_path / "PROTEXT.md").stat().st_size
+    except OSError:
+        return 0
+    # Same ~4 chars per token heuristic, applied to bytes
+    return size // 4
+
+
+def check_status(project_path: Path, layers: list = None) -> tuple:
+    """Fast health check for hooks: (exit code flags, one-line summary).
+
+    project_path is the nearest layer and layers its ancestor chain,
+    outermost first (see protext.layers). As in a load, config merges with
+    the nearest layer winning, the handoff comes from the nearest layer
+    that has one, and every layer's PROTEXT.md counts toward the budget.
+
+    Avoids full reads: only the handoff header bytes are read, config.yaml
+    is parsed with the simple parser, and PROTEXT.md token estimates come
+    from file sizes.
+    """
+    layers = layers or [project_path]
+    tier = detect_tier(project_path)
+    if tier == "none":
+        return CHECK_NOT_INITIALIZED, "none"
+
+    code = CHECK_OK
+    fields = [tier]
+
+    config = {}
+    for layer in layers:
+        config_path = layer / ".protext" / "config.yaml"
+        if config_path.exists():
+            config.update(parse_yaml_simple(config_path.read_text()))
+    has_config = bool(config) or tier == "advanced"
+
+    if has_config:
+        fields.append(f"@{config.get('active_scope', 'ops')}")
+
+    header = None
+    for layer in reversed(layers):
+        header = read_handoff_header(layer)
+        if header is not None:
+            break
+    if header is not None:
+        handoff_status = classify_handoff(header, get_handoff_ttl(config))["status"]
+        fields.append(f"handoff={handoff_status}")
+        if handoff_status == "STALE":
+            code |= CHECK_HANDOFF_STALE
+    elif tier in ("intermediate", "advanced"):
+        fields.append("handoff=MISSING")
+
+    if has_config:
+        budget = config_token_budget(config)
+        protext_tokens = sum(
+            estimate_protext_tokens_from_size(layer) for layer in layers
+        )
+        fields.append(f"tokens={protext_tokens}/{budget}")
+        if budget > 0 and protext_tokens > budget:
+            code |= CHECK_BUDGET_EXCEEDED
+
+    return code, " ".join(fields)
@@ -0,0 +1,192 @@
+"""
+protext.stats - Context usage ledger
+
+Appends per-session events to .protext/usage.jsonl and aggregates them
+into hit rates, never-used extractions, budget overruns and tuning
+recommendations.
+"""
+
+import json
+import math
+import os
+from datetime import datetime
+from pathlib import Path
+
+from .state import estimate_protext_tokens, get_token_budget, load_yaml
+
+LEDGER_PATH = Path(".protext") / "usage.jsonl"
+
+EVENTS = ("load", "extract", "used", "unused", "budget_hit")
+
+
+# An extraction loaded at least this often with a useful rate below
+# LOW_USE_RATE gets a "narrow triggers" recommendation.
+MIN_EXTRACTS_FOR_TUNING = 3
+LOW_USE_RATE = 0.34
+
+# Sessions with a recorded load needed before a token_budget is suggested
+MIN_SESSIONS_FOR_BUDGET = 5
+
+
+def ledger_enabled(project_path: Path, config: dict = None) -> bool:
+    """Check features.usage_ledger in config (enabled unless set false).
+
+    config defaults to project_path's own config.
+    """
+    if config is None:
+        config = load_yaml(project_path / ".protext" / "config.yaml")
+    features = config.get("features") or {}
+    if not isinstance(features, dict):
+        return True
+    return str(features.get("usage_ledger", True)).lower() not in ("false", "no", "0")
+
+
+def current_session() -> str:
+    """Session identifier for grouping ledger events."""
+    return os.environ.get("PROTEXT_SESSION") or datetime.now().strftime("%Y-%m-%d")
+
+
+def record_event(project_path: Path, event: str, name: str = None,
+                 tokens: int = 0, config: dict = None, **fields) -> bool:
+    """Append one event to the usage ledger. Returns False if disabled.
+
+    config is the effective config deciding features.usage_ledger; pass the
+    merged LayerStack config when recording into another layer's ledger.
+    """
+    protext_dir = project_path / ".protext"
+    if not protext_dir.is_dir() or not ledger_enabled(project_path, config):
+        return False
+
+    entry = {
+        "ts": datetime.now().isoformat(timespec="seconds"),
+        "session": current_session(),
+        "event": event,
+    }
+    if name is not None:
+        entry["name"] = name
+    if tokens:
+        entry["tokens"] = tokens
+    entry.update(fields)
+
+    with (project_path / LEDGER_PATH).open("a") as f:
+        f.write(json.dumps(entry) + "\n")
+    return True
+
+
+def read_ledger(project_path: Path) -> list:
+    """Read all ledger events, skipping malformed lines."""
+    ledger = project_path / LEDGER_PATH
+    if not ledger.exists():
+        return []
+
+    events = []
+    for line in ledger.read_text().splitlines():
+        try:
+            events.append(json.loads(line))
+        except ValueError:
+            continue
+    return events
+
+
+def summarize(project_path: Path) -> dict:
+    """Aggregate ledger events into per-session and per-extraction stats."""
+    budget = get_token_budget(project_path)
+    index = load_yaml(project_path / ".protext" / "index.yaml")
+    defined = index.get("extractions") or {}
+    if not isinstance(defined, dict):
+        defined = {}
+
+    sessions = {}
+    extractions = {
+        name: {"extracts": 0, "used": 0, "unused": 0, "tokens": 0, "cache_hits": 0}
+        for name in defined
+    }
+
+    for event in read_ledger(project_path):
+        session = sessions.setdefault(
+            event.get("session", "?"),
+            {"loads": 0, "extracts": 0, "tokens": 0, "budget_hits": 0},
+        )
+        kind = event.get("event")
+        tokens = event.get("tokens", 0)
+        # A load's tokens already include the extractions it rendered
+        if not event.get("in_load"):
+            session["tokens"] += tokens
+
+        if kind == "load":
+            session["loads"] += 1
+        elif kind == "budget_hit":
+            session["budget_hits"] += 1
+        elif kind in ("extract", "used", "unused"):
+            stats = extractions.setdefault(
+                event.get("name", "?"),
+                {"extracts": 0, "used": 0, "unused": 0, "tokens": 0, "cache_hits": 0},
+            )
+            if kind == "extract":
+                session["extracts"] += 1
+                stats["extracts"] += 1
+                stats["tokens"] += tokens
+                if event.get("cache") == "hit":
+                    stats["cache_hits"] += 1
+            else:
+                stats[kind] += 1
+
+    for stats in extractions.values():
+        rated = stats["used"] + stats["unused"]
+        stats["use_rate"] = stats["used"] / rated if rated else None
+
+    over_budget = [
+        name for name, s in sessions.items() if budget > 0 and s["tokens"] > budget
+    ]
+
+    return {
+        "budget": budget,
+        "protext_tokens": estimate_protext_tokens(project_path),
+        "sessions": sessions,
+        "extractions": extractions,
+        "never_extracted": sorted(
+            name for name in defined if extractions[name]["extracts"] == 0
+        ),
+        "never_used": sorted(
+            name for name, s in extractions.items()
+            if s["extracts"] > 0 and s["unused"] > 0 and s["used"] == 0
+        ),
+        "over_budget_sessions": sorted(over_budget),
+    }
+
+
+def tune(summary: dict) -> list:
+    """Recommend trigger edits and a token budget from a summary."""
+    recommendations = []
+
+    for name in summary["never_extracted"]:
+        recommendations.append(
+            f"@deep:{name}: never extracted - broaden its triggers or remove it from index.yaml"
+        )
+
+    for name, stats in sorted(summary["extractions"].items()):
+        if (stats["extracts"] >= MIN_EXTRACTS_FOR_TUNING
+                and stats["use_rate"] is not None
+                and stats["use_rate"] < LOW_USE_RATE):
+            recommendations.append(
+                f"@deep:{name}: useful in {stats['used']}/{stats['used'] + stats['unused']} "
+                f"rated loads - narrow its triggers or limit it with sections:"
+            )
+
+    # Only sessions that loaded context say what a session costs; extract-only
+    # sessions would pull the suggestion below PROTEXT.md itself.
+    totals = sorted(
+        s["tokens"] for s in summary["sessions"].values() if s["loads"] and s["tokens"]
+    )
+    if len(totals) >= MIN_SESSIONS_FOR_BUDGET:
+        # 90th percentile session, never below PROTEXT.md, rounded up to 100
+        p90 = totals[min(len(totals) - 1, math.ceil(0.9 * len(totals)) - 1)]
+        p90 = max(p90, summary.get("protext_tokens", 0))
+        suggested = int(math.ceil(p90 / 100.0) * 100)
+        if suggested != summary["budget"]:
+            recommendations.append(
+                f"token_budget: {suggested} covers 90% of {len(totals)} recorded "
+                f"sessions (currently {summary['budget']})"
+            )
+
+    return recommendations
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+protext_extract.py - Render a deep-context extraction from the index
+
+Resolves `@deep:<name>` by reading the extraction's source document,
+keeping only the sections listed in the index entry (if any) and
+truncating to the token budget.
+
+Rendered payloads are cached in .protext/.cache/ keyed by the source hash
+and the extraction parameters, so repeated extractions of an unchanged
+document skip re-processing. The cache is bounded by
+`extraction_cache_bytes` in config.yaml and evicts least recently used
+entries. Hit/miss counters are shown by protext_status.py.
+
+Usage:
+    python protext_extract.py <project-path> <name> [--budget N] [--no-cache]
+    python protext_extract.py <project-path> --list
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from protext.extraction import extract
+from protext.layers import LayerStack
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render a protext deep-context extraction"
+    )
+    parser.add_argument(
+        "project_path",
+        type=Path,
+        help="Path to the project directory"
+    )
+    parser.add_argument(
+        "name",
+        nargs="?",
+        help="Extraction name from .protext/index.yaml"
+    )
+    parser.add_argument(
+        "--budget",
+        type=int,
+        default=None,
+        help="Token cap for the rendered payload (default: config token_budget)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Render from source without reading or writing the cache"
+    )
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="List available extractions"
+    )
+
+    args = parser.parse_args()
+    stack = LayerStack(args.project_path)
+
+    if args.list or not args.name:
+        for name, (layer, entry) in stack.extractions().items():
+            summary = entry.get("summary", "") if isinstance(entry, dict) else ""
+            print(f"  @deep:{name:<16} {summary}")
+        return
+
+    try:
+        result = extract(stack.owner(args.name), args.name, args.budget,
+                         use_cache=not args.no_cache, config=stack.config())
+    except KeyError:
+        print(f"Error: Extraction not found: {args.name}")
+        sys.exit(1)
+    except FileNotFoundError as e:
+        print(f"Error: Extraction source not found: {e}")
+        sys.exit(1)
+
+    sys.stdout.write(result.content)
+
+
+if __name__ == "__main__":
+    main()
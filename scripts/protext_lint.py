@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+protext_lint.py - Lint protext content
+
+Currently checks for near-duplicate paragraphs and bullets across
+PROTEXT.md, handoff.md, scope files and extraction sources, which cost
+tokens on every load that includes more than one of them. In a monorepo the
+ancestor layers a load merges are included, labelled relative to the root
+layer.
+
+Usage:
+    python protext_lint.py <project-path> --duplicates [--threshold 0.8]
+
+Exits 1 when duplicates are found.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from protext.dedup import DEFAULT_THRESHOLD, find_duplicates, normalize
+from protext.lint import gather_documents
+
+
+def print_duplicates(clusters: list) -> None:
+    """Print duplicate clusters with their estimated token cost.
+
+    Clusters whose wording differs are marked [near]: loads keep every copy,
+    so they need rewording (or confirming) by hand.
+    """
+    wasted = 0
+    for members in clusters:
+        first_label, first_text = members[0]
+        preview = first_text.strip().split('\n')[0]
+        if len(preview) > 70:
+            preview = preview[:67] + "..."
+        exact = len({normalize(text) for _, text in members}) == 1
+        print(f"  {'' if exact else '[near] '}{preview}")
+        for label, text in members:
+            print(f"    - {label}")
+        wasted += sum(len(text) for _, text in members[1:]) // 4
+        print()
+
+    print(f"  {len(clusters)} duplicated blocks, ~{wasted} tokens repeated")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Lint protext content"
+    )
+    parser.add_argument(
+        "project_path",
+        type=Path,
+        nargs="?",
+        default=Path.cwd(),
+        help="Path to the project directory (default: current directory)"
+    )
+    parser.add_argument(
+        "--duplicates",
+        action="store_true",
+        help="Report near-duplicate paragraphs across protext documents"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Similarity threshold for duplicates (default: {DEFAULT_THRESHOLD})"
+    )
+
+    args = parser.parse_args()
+
+    if not args.duplicates:
+        parser.error("no checks selected (use --duplicates)")
+
+    # Includes ancestor layers, as protext_load.py does
+    documents = gather_documents(args.project_path.resolve())
+    if not documents:
+        print("Error: Protext not initialized")
+        sys.exit(1)
+
+    clusters = find_duplicates(documents, args.threshold)
+    if not clusters:
+        print("No duplicates found.")
+        return
+
+    print_duplicates(clusters)
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
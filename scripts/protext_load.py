@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+protext_load.py - Assemble /protext orientation context for a session
+
+Concatenates PROTEXT.md, the session handoff, the active (or requested)
+scope file and any requested @deep: extractions, in that order. Repeated
+paragraphs and bullets across these parts are emitted once, with a
+back-reference where later copies were dropped (see protext/dedup.py).
+
+Run from inside a monorepo package, every PROTEXT.md from the repository
+root down to the package is loaded, and scopes and extractions resolve to
+the nearest layer that defines them (see protext/layers.py).
+
+Usage:
+    python protext_load.py [path] [@scope] [--deep NAME ...]
+                                  [--full] [--minimal] [--no-dedup]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from protext.layers import LayerStack
+from protext.loader import ScopeNotFoundError, load_context
+from protext.state import classify_handoff, get_handoff_ttl
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Load protext orientation context"
+    )
+    parser.add_argument(
+        "project_path",
+        type=Path,
+        nargs="?",
+        default=Path.cwd(),
+        help="Working directory inside the project (default: current directory)"
+    )
+    parser.add_argument(
+        "scope",
+        nargs="?",
+        help="Scope override, e.g. @security"
+    )
+    parser.add_argument(
+        "--deep",
+        action="append",
+        default=[],
+        metavar="NAME",
+        help="Include an extraction (repeatable)"
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="List available extractions"
+    )
+    parser.add_argument(
+        "--minimal",
+        action="store_true",
+        help="PROTEXT.md only, no scope or handoff"
+    )
+    parser.add_argument(
+        "--no-dedup",
+        action="store_true",
+        help="Emit parts verbatim without removing repeated content"
+    )
+
+    args = parser.parse_args()
+
+    # "protext_load.py @security" - scope given without a path
+    if args.scope is None and str(args.project_path).startswith("@"):
+        args.scope = str(args.project_path)
+        args.project_path = Path.cwd()
+
+    project_path = args.project_path.resolve()
+    scope = args.scope.lstrip("@") if args.scope else None
+    stack = LayerStack(project_path)
+
+    if stack.nearest is None:
+        print("Protext not initialized. Run 'protext init' to set it up.")
+        sys.exit(1)
+
+    try:
+        result = load_context(project_path, scope, args.deep, args.minimal,
+                              dedup=not args.no_dedup)
+    except ScopeNotFoundError as e:
+        print(f"Error: Scope not found: {e.scope}")
+        sys.exit(1)
+    except KeyError as e:
+        print(f"Error: Extraction not found: {e.args[0]}")
+        sys.exit(1)
+    except FileNotFoundError as e:
+        print(f"Error: Extraction source not found: {e}")
+        sys.exit(1)
+
+    sys.stdout.write(result.text)
+
+    handoff_path = stack.handoff_path()
+    if handoff_path is not None:
+        handoff = classify_handoff(handoff_path.read_text(),
+                                   get_handoff_ttl(stack.config()))
+        print(f"\nHandoff: {handoff['status']}")
+
+    if args.full:
+        names = list(stack.extractions())
+        if names:
+            print("Extractions available: " + ", ".join(f"@deep:{n}" for n in names))
+
+
+if __name__ == "__main__":
+    main()
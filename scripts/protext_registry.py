@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+protext_registry.py - Fleet registry of protext projects
+
+Keeps a local SQLite database of protext state across many projects so
+fleet-wide questions ("which projects have STALE handoffs in @security?")
+are answered by SQL lookups instead of walking the disk.
+
+Projects are recorded by protext_status.py / init_protext.py runs (with
+--registry or PROTEXT_REGISTRY set) and by `refresh`. Refresh is
+incremental: a project is only re-read when one of its protext files has a
+newer mtime than recorded, and extraction sources are only re-hashed when
+their own mtime changes.
+
+Usage:
+    python protext_registry.py refresh [ROOT ...]
+    python protext_registry.py query [--status STALE] [--scope security]
+                                     [--tier advanced] [--extraction NAME]
+                                     [--over-budget] [--json]
+    python protext_registry.py export [--format json|csv] [--output FILE]
+
+Database: --db PATH, else $PROTEXT_REGISTRY, else ~/.protext/registry.db
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from protext.registry import connect, export, query, refresh, registry_path
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Fleet registry of protext projects"
+    )
+    parser.add_argument(
+        "--db",
+        type=Path,
+        default=None,
+        help="Registry database (default: $PROTEXT_REGISTRY or ~/.protext/registry.db)"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    refresh_parser = sub.add_parser(
+        "refresh", help="Discover projects under ROOTs and refresh changed ones"
+    )
+    refresh_parser.add_argument(
+        "roots", type=Path, nargs="*",
+        help="Directories to scan for PROTEXT.md (default: registered projects only)"
+    )
+
+    query_parser = sub.add_parser("query", help="List projects matching filters")
+    query_parser.add_argument("--status", choices=["FRESH", "AGING", "STALE", "UNKNOWN"])
+    query_parser.add_argument("--scope", help="Active scope, e.g. security or @security")
+    query_parser.add_argument("--tier", choices=["beginner", "intermediate", "advanced"])
+    query_parser.add_argument("--extraction", help="Projects defining this extraction")
+    query_parser.add_argument("--over-budget", action="store_true",
+                              help="PROTEXT.md estimate exceeds token budget")
+    query_parser.add_argument("--json", action="store_true", help="Output rows as JSON")
+
+    export_parser = sub.add_parser("export", help="Dump the registry")
+    export_parser.add_argument("--format", choices=["json", "csv"], default="json")
+    export_parser.add_argument("--output", "-o", type=Path, default=None,
+                               help="Write to file instead of stdout")
+
+    args = parser.parse_args()
+    conn = connect(registry_path(args.db))
+
+    try:
+        if args.command == "refresh":
+            counts = refresh(conn, args.roots)
+            print(f"Scanned {counts['scanned']} projects: "
+                  f"{counts['updated']} updated, {counts['removed']} removed")
+
+        elif args.command == "query":
+            rows = query(conn, args.status, args.scope, args.tier,
+                         args.extraction, args.over_budget)
+            if args.json:
+                print(json.dumps(rows, indent=2))
+            else:
+                for row in rows:
+                    print(row["path"])
+
+        elif args.command == "export":
+            if args.output:
+                with args.output.open("w", newline="") as out:
+                    export(conn, args.format, out)
+            else:
+                export(conn, args.format, sys.stdout)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+protext_stats.py - Context usage ledger and report
+
+Records what protext actually loaded in each session to an append-only
+ledger (.protext/usage.jsonl) and reports hit rates, never-used
+extractions and budget overruns. With --tune, recommends trigger edits and
+a token_budget value derived from the recorded sessions.
+
+Loads and extractions are appended automatically by protext_load.py and
+protext_extract.py. Agents record whether an extraction was actually useful,
+and record a load only when they assemble context without protext_load.py:
+
+Usage:
+    python protext_stats.py <project-path> [--tune] [--json]
+    python protext_stats.py <project-path> record load [--tokens N]
+    python protext_stats.py <project-path> record used <name>
+    python protext_stats.py <project-path> record unused <name>
+
+Sessions are grouped by $PROTEXT_SESSION (default: today's date).
+Recording is disabled by `features.usage_ledger: false` in config.yaml.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from protext.stats import EVENTS, record_event, summarize, tune
+
+
+def print_report(project_path: Path, summary: dict, recommendations: list = None):
+    """Print formatted usage report."""
+    sessions = summary["sessions"]
+    budget = summary["budget"]
+
+    print(f"\n{'='*50}")
+    print(f" Protext Usage: {project_path.name}")
+    print(f"{'='*50}\n")
+
+    if not sessions:
+        print("  No usage recorded yet.\n")
+        return
+
+    total_tokens = sum(s["tokens"] for s in sessions.values())
+    print(f"  Sessions:       {len(sessions)}")
+    print(f"  Avg Tokens:     ~{total_tokens // len(sessions)}/{budget} per session")
+    print(f"  Over Budget:    {len(summary['over_budget_sessions'])} sessions")
+    print()
+
+    print("  Extractions:")
+    for name, stats in sorted(summary["extractions"].items()):
+        if stats["use_rate"] is None:
+            rate = "unrated"
+        else:
+            rate = f"{stats['use_rate'] * 100:.0f}% useful"
+        print(f"    @deep:{name:<16} {stats['extracts']:>3} loads  "
+              f"~{stats['tokens']:>6} tokens  {rate}")
+    print()
+
+    if summary["never_extracted"]:
+        print(f"  Never extracted: {', '.join(summary['never_extracted'])}")
+    if summary["never_used"]:
+        print(f"  Never useful:    {', '.join(summary['never_used'])}")
+    if summary["never_extracted"] or summary["never_used"]:
+        print()
+
+    if recommendations is not None:
+        print("  Recommendations:")
+        for rec in recommendations or ["None - usage matches configuration"]:
+            print(f"    - {rec}")
+        print()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Report or record protext context usage"
+    )
+    parser.add_argument(
+        "project_path",
+        type=Path,
+        help="Path to the project directory"
+    )
+    parser.add_argument(
+        "action",
+        nargs="?",
+        choices=["record"],
+        help="Record an event instead of reporting"
+    )
+    parser.add_argument(
+        "event",
+        nargs="?",
+        choices=EVENTS,
+        help="Event to record"
+    )
+    parser.add_argument(
+        "name",
+        nargs="?",
+        help="Extraction name (for extract/used/unused)"
+    )
+    parser.add_argument(
+        "--tokens",
+        type=int,
+        default=0,
+        help="Tokens consumed by the recorded event"
+    )
+    parser.add_argument(
+        "--tune",
+        action="store_true",
+        help="Recommend trigger edits and a token budget"
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output report as JSON"
+    )
+
+    args = parser.parse_args()
+    project_path = args.project_path.resolve()
+
+    if not (project_path / ".protext").is_dir():
+        print(f"Error: Protext not initialized: {project_path}")
+        sys.exit(1)
+
+    if args.action == "record":
+        if args.event is None:
+            parser.error("record requires an event")
+        if args.event in ("extract", "used", "unused") and not args.name:
+            parser.error(f"record {args.event} requires an extraction name")
+        record_event(project_path, args.event, args.name, args.tokens)
+        return
+
+    summary = summarize(project_path)
+    recommendations = tune(summary) if args.tune else None
+
+    if args.json:
+        if recommendations is not None:
+            summary["recommendations"] = recommendations
+        print(json.dumps(summary, indent=2))
+    else:
+        print_report(project_path, summary, recommendations)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,193 +7,27 @@ token budget status, and available extractions.
 
 Usage:
     python protext_status.py <project-path>
+    python protext_status.py <project-path> --check [--line]
+
+--check is a fast, quiet mode for agent hooks. It reads only the handoff
+header and estimates tokens from file size, then exits with a bit flag code:
+    0   OK
+    4   not initialized
+    8   handoff STALE
+    16  PROTEXT.md over token budget
+Flags combine (e.g. 24 = stale and over budget). --line also prints a
+one-line summary such as "advanced @ops handoff=FRESH tokens=380/2000".
 """
 
 import argparse
+import os
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
-import re
-
-try:
-    import yaml
-    YAML_AVAILABLE = True
-except ImportError:
-    YAML_AVAILABLE = False
-
-
-def parse_yaml_simple(content: str) -> dict:
-    """Simple YAML parser for basic key-value extraction."""
-    result = {}
-    current_section = None
-
-    for line in content.split('\n'):
-        # Skip comments and empty lines
-        if line.strip().startswith('#') or not line.strip():
-            continue
-
-        # Check for top-level key
-        if not line.startswith(' ') and ':' in line:
-            key, _, value = line.partition(':')
-            key = key.strip()
-            value = value.strip()
-            if value:
-                result[key] = value
-            else:
-                result[key] = {}
-                current_section = key
-        elif current_section and line.startswith('  ') and ':' in line:
-            key, _, value = line.partition(':')
-            key = key.strip()
-            value = value.strip()
-            if isinstance(result[current_section], dict):
-                result[current_section][key] = value
-
-    return result
-
-
-def load_yaml(path: Path) -> dict:
-    """Load YAML file with fallback to simple parser."""
-    if not path.exists():
-        return {}
-
-    content = path.read_text()
-
-    if YAML_AVAILABLE:
-        try:
-            return yaml.safe_load(content) or {}
-        except yaml.YAMLError:
-            pass
-
-    return parse_yaml_simple(content)
-
-
-def detect_tier(project_path: Path) -> str:
-    """Detect the protext tier based on existing files."""
-    protext_md = project_path / "PROTEXT.md"
-    protext_dir = project_path / ".protext"
-    handoff_md = protext_dir / "handoff.md"
-    index_yaml = protext_dir / "index.yaml"
-
-    if not protext_md.exists():
-        return "none"
-    if not protext_dir.exists():
-        return "beginner"
-    if not index_yaml.exists():
-        return "intermediate"
-    return "advanced"
-
-
-def parse_handoff_status(project_path: Path) -> dict:
-    """Parse handoff.md for status information."""
-    handoff_path = project_path / ".protext" / "handoff.md"
-
-    result = {
-        "exists": False,
-        "updated": None,
-        "status": "UNKNOWN",
-        "age_hours": None,
-    }
-
-    if not handoff_path.exists():
-        return result
-
-    result["exists"] = True
-    content = handoff_path.read_text()
-
-    # Extract timestamp from header
-    # Format: > Updated: YYYY-MM-DDTHH:MM | TTL: 48h | Status: FRESH
-    header_match = re.search(
-        r'Updated:\s*(\d{4}-\d{2}-\d{2}T\d{2}:\d{2})',
-        content
-    )
-
-    if header_match:
-        try:
-            updated = datetime.fromisoformat(header_match.group(1))
-            result["updated"] = updated
-            age = datetime.now() - updated
-            result["age_hours"] = age.total_seconds() / 3600
-
-            if result["age_hours"] < 24:
-                result["status"] = "FRESH"
-            elif result["age_hours"] < 48:
-                result["status"] = "AGING"
-            else:
-                result["status"] = "STALE"
-        except ValueError:
-            pass
-
-    # Check for explicit status in header
-    status_match = re.search(r'Status:\s*(\w+)', content)
-    if status_match:
-        explicit_status = status_match.group(1).upper()
-        if explicit_status in ("FRESH", "AGING", "STALE"):
-            result["status"] = explicit_status
-
-    return result
-
-
-def count_extractions(project_path: Path) -> int:
-    """Count extractions in index.yaml."""
-    index_path = project_path / ".protext" / "index.yaml"
-
-    if not index_path.exists():
-        return 0
-
-    data = load_yaml(index_path)
-    extractions = data.get("extractions", {})
-
-    if isinstance(extractions, dict):
-        return len(extractions)
-    return 0
-
-
-def count_scopes(project_path: Path) -> int:
-    """Count scope files."""
-    scopes_dir = project_path / ".protext" / "scopes"
-
-    if not scopes_dir.exists():
-        return 0
-
-    return len(list(scopes_dir.glob("*.md")))
-
-
-def get_active_scope(project_path: Path) -> str:
-    """Get active scope from config."""
-    config_path = project_path / ".protext" / "config.yaml"
-
-    if not config_path.exists():
-        return "none"
 
-    data = load_yaml(config_path)
-    return data.get("active_scope", "ops")
-
-
-def get_token_budget(project_path: Path) -> int:
-    """Get token budget from config."""
-    config_path = project_path / ".protext" / "config.yaml"
-
-    if not config_path.exists():
-        return 2000  # Default
-
-    data = load_yaml(config_path)
-    try:
-        return int(data.get("token_budget", 2000))
-    except (ValueError, TypeError):
-        return 2000
-
-
-def estimate_protext_tokens(project_path: Path) -> int:
-    """Rough estimate of PROTEXT.md token count."""
-    protext_md = project_path / "PROTEXT.md"
-
-    if not protext_md.exists():
-        return 0
-
-    content = protext_md.read_text()
-    # Rough estimate: ~4 chars per token
-    return len(content) // 4
+# Only the --check path is imported eagerly; the full report loads protext.api
+from protext.layers import find_layers
+from protext.state import check_status
 
 
 def format_age(hours: float) -> str:
@@ -221,9 +55,10 @@ def status_color(status: str) -> str:
     return f"{color}{status}{reset}"
 
 
-def print_status(project_path: Path):
-    """Print formatted protext status."""
-    tier = detect_tier(project_path)
+def print_status(status):
+    """Print a formatted report of a protext.models.Status."""
+    project_path = status.path
+    tier = status.tier
 
     print(f"\n{'='*50}")
     print(f" Protext Status: {project_path.name}")
@@ -243,33 +78,49 @@ def print_status(project_path: Path):
     }
     print(f"  Tier:           {tier_icons.get(tier, '[ ]')} {tier.title()}")
 
+    # Nested layers (monorepo); scope/extraction limits apply per layer
+    layers = status.layers
+    layered = len(layers) > 1
+    if layered:
+        names = [str(layer.relative_to(layers[0])) for layer in layers[1:]]
+        print(f"  Layers:         {layers[0].name} > {' > '.join(names)}")
+
     # Active scope
-    if tier == "advanced":
-        scope = get_active_scope(project_path)
-        scope_count = count_scopes(project_path)
-        print(f"  Active Scope:   @{scope} ({scope_count}/5 scopes)")
+    if status.active_scope is not None:
+        limit = "" if layered else "/5"
+        print(f"  Active Scope:   @{status.active_scope} "
+              f"({status.scope_count}{limit} scopes)")
 
     # Handoff status
-    if tier in ("intermediate", "advanced"):
-        handoff = parse_handoff_status(project_path)
-        if handoff["exists"]:
-            age_str = format_age(handoff["age_hours"])
-            status_str = status_color(handoff["status"])
-            print(f"  Handoff:        {status_str} (age: {age_str})")
-        else:
-            print(f"  Handoff:        Not captured")
+    handoff = status.handoff
+    if handoff.exists:
+        age_str = format_age(handoff.age_hours)
+        status_str = status_color(handoff.status)
+        inherited = ""
+        if handoff.path.parent.parent != project_path:
+            inherited = f" from {handoff.path.relative_to(layers[0])}"
+        print(f"  Handoff:        {status_str} (age: {age_str}){inherited}")
+    elif tier in ("intermediate", "advanced"):
+        print(f"  Handoff:        Not captured")
 
     # Token budget
-    if tier == "advanced":
-        budget = get_token_budget(project_path)
-        protext_tokens = estimate_protext_tokens(project_path)
-        usage_pct = (protext_tokens / budget) * 100 if budget > 0 else 0
-        print(f"  Token Budget:   ~{protext_tokens}/{budget} ({usage_pct:.0f}%)")
+    if status.active_scope is not None:
+        budget = status.token_budget
+        usage_pct = (status.protext_tokens / budget) * 100 if budget > 0 else 0
+        print(f"  Token Budget:   ~{status.protext_tokens}/{budget} ({usage_pct:.0f}%)")
 
     # Extractions
-    if tier == "advanced":
-        extraction_count = count_extractions(project_path)
-        print(f"  Extractions:    {extraction_count}/20 defined")
+    if status.active_scope is not None:
+        limit = "" if layered else "/20"
+        print(f"  Extractions:    {status.extraction_count}{limit} defined")
+
+    cache = status.cache
+    if cache is not None:
+        lookups = cache["hits"] + cache["misses"]
+        hit_pct = (cache["hits"] / lookups) * 100 if lookups else 0
+        print(f"  Extract Cache:  {cache['hits']} hits / {cache['misses']} misses "
+              f"({hit_pct:.0f}%), {cache['bytes'] // 1024}/"
+              f"{cache['max_bytes'] // 1024} KiB")
 
     print()
 
@@ -308,6 +159,25 @@ def main():
         default=Path.cwd(),
         help="Path to the project directory (default: current directory)"
     )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Fast check for hooks: print nothing, report via exit code "
+             "(0 ok, 4 not initialized, 8 handoff stale, 16 over budget; "
+             "flags combine)"
+    )
+    parser.add_argument(
+        "--line",
+        action="store_true",
+        help="With --check, print a single summary line"
+    )
+    parser.add_argument(
+        "--registry",
+        type=Path,
+        default=os.environ.get("PROTEXT_REGISTRY"),
+        help="Also record this project in the fleet registry database "
+             "(default: $PROTEXT_REGISTRY; unset disables)"
+    )
 
     args = parser.parse_args()
     project_path = args.project_path.resolve()
@@ -320,7 +190,22 @@ def main():
         print(f"Error: Not a directory: {project_path}")
         sys.exit(1)
 
-    print_status(project_path)
+    if args.check:
+        # Nearest layer, inheriting handoff and config from its ancestors
+        layers = find_layers(project_path)
+        code, line = check_status(layers[-1] if layers else project_path, layers)
+        if args.line:
+            print(line)
+        sys.exit(code)
+
+    from protext.api import status
+    result = status(project_path)
+    print_status(result)
+    project_path = result.path
+
+    if args.registry:
+        from protext.registry import update_registry
+        update_registry(project_path, Path(args.registry).expanduser())
 
 
 if __name__ == "__main__":
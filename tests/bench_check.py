@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+bench_check.py - Time `protext_status.py --check` as a hook runs it
+
+Hooks spawn a fresh interpreter on every agent turn, so the number that
+matters is process wall time, not in-process call time. This runs the CLI
+repeatedly against a generated advanced-tier project and reports the median
+overhead above a bare `python -c pass`.
+
+Usage:
+    python tests/bench_check.py [--runs 30] [--target-ms 50]
+
+Exits 1 when the median overhead exceeds the target.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+SCRIPTS = Path(__file__).resolve().parent.parent / "scripts"
+STATUS = SCRIPTS / "protext_status.py"
+
+# Median wall-time budget above interpreter startup for one --check call.
+# The stdlib imports a CLI needs (argparse, pathlib, re, datetime) take about
+# 30 ms of this; protext itself should add only a few ms, and never PyYAML.
+DEFAULT_TARGET_MS = 50.0
+
+
+def make_project(root: Path) -> Path:
+    """Create a nested advanced-tier project (root layer plus one package)."""
+    (root / ".git").mkdir()
+    updated = datetime.now().strftime("%Y-%m-%dT%H:%M")
+    for layer in (root, root / "packages" / "api"):
+        protext_dir = layer / ".protext"
+        (protext_dir / "scopes").mkdir(parents=True)
+        (layer / "PROTEXT.md").write_text("# Protext\n\n" + "context line\n" * 200)
+        (protext_dir / "config.yaml").write_text(
+            "version: 1\ntoken_budget: 2000  # per load\nactive_scope: ops\n"
+        )
+        (protext_dir / "index.yaml").write_text("extractions: {}\n")
+        (protext_dir / "handoff.md").write_text(
+            f"# Handoff\n> Updated: {updated} | TTL: 48h | Status: FRESH\n"
+            + "note\n" * 500
+        )
+    return root / "packages" / "api"
+
+
+def time_runs(commands: list, runs: int) -> list:
+    """Wall times in ms per command, interleaving runs to cancel drift."""
+    # Let the warm-up write bytecode, as an installed skill would have it
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    samples = [[] for _ in commands]
+    for _ in range(runs):
+        for argv, times in zip(commands, samples):
+            start = time.perf_counter()
+            subprocess.run(argv, stdout=subprocess.DEVNULL, env=env)
+            times.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the protext_status.py --check hook path"
+    )
+    parser.add_argument("--runs", type=int, default=30,
+                        help="Runs per command (default: 30)")
+    parser.add_argument("--target-ms", type=float, default=DEFAULT_TARGET_MS,
+                        help="Allowed median overhead over bare interpreter "
+                             f"startup (default: {DEFAULT_TARGET_MS:.0f})")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project = make_project(Path(tmp))
+        commands = [
+            [sys.executable, "-c", "pass"],
+            [sys.executable, str(STATUS), str(project), "--check"],
+        ]
+
+        # Warm up filesystem caches and bytecode for both commands
+        time_runs(commands, 3)
+        baseline, measured = map(statistics.median,
+                                 time_runs(commands, args.runs))
+
+    overhead = measured - baseline
+    print(f"python -c pass:   {baseline:6.1f} ms (median of {args.runs})")
+    print(f"--check:          {measured:6.1f} ms (median of {args.runs})")
+    print(f"overhead:         {overhead:6.1f} ms (target {args.target_ms:.0f} ms)")
+
+    sys.exit(0 if overhead <= args.target_ms else 1)
+
+
+if __name__ == "__main__":
+    main()
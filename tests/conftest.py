@@ -0,0 +1,57 @@
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+
+def write_project(path: Path, tier: str = "advanced", handoff_age_hours: float = 1,
+                  config: str = None, extractions: dict = None,
+                  scopes: tuple = ("ops",), handoff_status: str = None) -> Path:
+    """Create a protext project (or nested layer) under path.
+
+    handoff_status adds an explicit "| Status: X" to the handoff header, as
+    the init template does.
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "PROTEXT.md").write_text(f"# {path.name}\n\nOrientation for {path.name}.\n")
+    if tier == "beginner":
+        return path
+
+    protext_dir = path / ".protext"
+    protext_dir.mkdir(exist_ok=True)
+    if handoff_age_hours is not None:
+        updated = datetime.now() - timedelta(hours=handoff_age_hours)
+        status = f" | Status: {handoff_status}" if handoff_status else ""
+        (protext_dir / "handoff.md").write_text(
+            f"# Session Handoff\n> Updated: {updated.strftime('%Y-%m-%dT%H:%M')}"
+            f" | TTL: 48h{status}\n\nNotes.\n"
+        )
+    if tier == "intermediate":
+        return path
+
+    (protext_dir / "config.yaml").write_text(
+        config if config is not None else "token_budget: 2000\nactive_scope: ops\n"
+    )
+    lines = ["extractions:"]
+    for name, source in (extractions or {}).items():
+        lines += [f"  {name}:", f"    source: {source}", f"    summary: {name} notes"]
+    (protext_dir / "index.yaml").write_text("\n".join(lines) + "\n")
+
+    (protext_dir / "scopes").mkdir(exist_ok=True)
+    for scope in scopes:
+        (protext_dir / "scopes" / f"{scope}.md").write_text(f"# @{scope} ({path.name})\n")
+    return path
+
+
+@pytest.fixture
+def make_project():
+    return write_project
+
+
+@pytest.fixture(autouse=True)
+def _isolate_env(monkeypatch):
+    monkeypatch.delenv("PROTEXT_SESSION", raising=False)
+    monkeypatch.delenv("PROTEXT_REGISTRY", raising=False)
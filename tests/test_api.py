@@ -0,0 +1,67 @@
+import pytest
+
+import protext
+from protext.state import CHECK_NOT_INITIALIZED, CHECK_OK
+
+
+@pytest.fixture
+def quiet(capsys):
+    """Fails the test if an API call printed anything."""
+    yield
+    out, err = capsys.readouterr()
+    assert (out, err) == ("", "")
+
+
+def test_init_creates_project(tmp_path, quiet):
+    result = protext.init(tmp_path)
+
+    assert isinstance(result, protext.InitResult)
+    assert result.tier == "advanced"
+    assert {"PROTEXT.md", ".protext/handoff.md", ".protext/config.yaml"} <= set(result.created)
+
+    status = protext.status(tmp_path)
+    assert (status.tier, status.code, status.handoff.status) == ("advanced", CHECK_OK, "FRESH")
+
+
+def test_init_refuses_existing_project(tmp_path, quiet):
+    protext.init(tmp_path, tier="intermediate")
+
+    with pytest.raises(protext.ProtextExistsError) as info:
+        protext.init(tmp_path)
+    assert info.value.found == ["PROTEXT.md", ".protext/"]
+
+    assert protext.init(tmp_path, existing="update").tier == "advanced"
+
+
+def test_init_missing_path(tmp_path, quiet):
+    with pytest.raises(FileNotFoundError):
+        protext.init(tmp_path / "missing")
+
+
+def test_uninitialized_path(tmp_path, quiet):
+    state = protext.load_state(tmp_path)
+    assert (state.tier, state.layers, state.handoff.exists) == ("none", [], False)
+
+    status = protext.status(tmp_path)
+    assert (status.tier, status.code, status.line) == ("none", CHECK_NOT_INITIALIZED, "none")
+
+    with pytest.raises(FileNotFoundError):
+        protext.load(tmp_path)
+
+
+def test_extract_unknown_name(tmp_path, make_project, quiet):
+    project = make_project(tmp_path / "p")
+
+    with pytest.raises(KeyError):
+        protext.extract(project, "nope")
+
+
+def test_extract_and_load_return_content_without_printing(tmp_path, make_project, quiet):
+    project = make_project(tmp_path / "p", extractions={"net": "docs/net.md"})
+    (project / "docs").mkdir()
+    (project / "docs" / "net.md").write_text("# Net\n\nDNS notes.\n")
+
+    assert "DNS notes." in protext.extract(project, "net").content
+    result = protext.load(project, scope="@ops", deep=["net"])
+    assert result.parts == ["PROTEXT.md", ".protext/handoff.md",
+                            ".protext/scopes/ops.md", "@deep:net"]
@@ -0,0 +1,76 @@
+import pytest
+
+from protext.dedup import Deduplicator, find_duplicates, segments
+
+SAMPLES = [
+    "",
+    "\n",
+    "single line without newline",
+    "# Title\n\nA paragraph that\nwraps twice.\n\n\n- item one\n  continued\n- item two\n",
+    "```python\ncode = 1\n\n# not a heading\n```\ntrailing text\n\n1. first\n2) second",
+    "  indented text\n\t\n# H\n```\nunclosed fence\n",
+]
+
+CAUTION = "- Never restart the primary database during business hours without approval"
+
+
+@pytest.mark.parametrize("content", SAMPLES)
+def test_segments_round_trip_exactly(content):
+    assert '\n'.join(text for _, text in segments(content)) == content
+
+
+def test_segments_units():
+    pieces = segments("# H\n\npara one\npara two\n- a\n- b\n```\nx\n```\n")
+    assert [text for is_unit, text in pieces if is_unit] == [
+        "para one\npara two", "- a", "- b", "```\nx\n```",
+    ]
+
+
+def test_dedupe_replaces_repeat_with_back_reference():
+    dedup = Deduplicator()
+    first = dedup.dedupe("PROTEXT.md", f"# Cautions\n\n{CAUTION}\n")
+    second = dedup.dedupe("scopes/ops.md", f"# Ops\n\n{CAUTION}\n- Check backups daily at noon\n")
+
+    assert CAUTION in first
+    assert CAUTION not in second
+    assert "> (duplicate content omitted - see PROTEXT.md)" in second
+    assert "- Check backups daily at noon" in second
+    assert second.startswith("# Ops\n")
+    assert dedup.removed == 1
+
+
+def test_dedupe_keeps_units_that_differ_by_one_word():
+    always = ("- Always run the migration script before deploying the api service "
+              "to staging or production so schema changes land first")
+    never = always.replace("Always", "Never")
+    dedup = Deduplicator()
+    dedup.dedupe("A", always + "\n")
+
+    assert dedup.dedupe("B", never + "\n") == never + "\n"
+    assert dedup.removed == 0
+    assert find_duplicates({"A": always, "B": never})  # lint still reports it
+
+
+def test_dedupe_drops_unit_contained_in_earlier_one():
+    dedup = Deduplicator()
+    dedup.dedupe("PROTEXT.md", f"Cautions: {CAUTION[2:]}. Ask in #ops first.\n")
+
+    assert dedup.dedupe("scopes/ops.md", f"{CAUTION}\n") == \
+        "> (duplicate content omitted - see PROTEXT.md)\n"
+
+
+def test_dedupe_keeps_headings_and_short_units():
+    dedup = Deduplicator()
+    dedup.dedupe("a", "# Notes\n\n- ok\n")
+    assert dedup.dedupe("b", "# Notes\n\n- ok\n") == "# Notes\n\n- ok\n"
+
+
+def test_find_duplicates_clusters_across_documents():
+    clusters = find_duplicates({
+        "PROTEXT.md": f"{CAUTION}\n",
+        "handoff.md": "Unrelated handoff notes about the deploy\n",
+        "scopes/ops.md": f"{CAUTION.upper()}\n",
+    })
+    assert [[label for label, _ in members] for members in clusters] == [
+        ["PROTEXT.md", "scopes/ops.md"],
+    ]
@@ -0,0 +1,96 @@
+import itertools
+
+import pytest
+
+from protext import extraction
+from protext.extraction import ExtractionCache, extract
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Deterministic, strictly increasing time.time() for LRU ordering."""
+    ticks = itertools.count(1000)
+    monkeypatch.setattr(extraction.time, "time", lambda: next(ticks))
+
+
+def test_cache_stays_under_cap_and_evicts_lru(tmp_path, make_project, clock):
+    project = make_project(tmp_path / "p")
+    cache = ExtractionCache(project, max_bytes=250)
+
+    for key in ("a", "b"):
+        cache.put(key, "x" * 100)
+    assert cache.get("a") is not None  # a is now more recent than b
+
+    cache.put("c", "x" * 100)
+
+    assert set(cache.manifest["entries"]) == {"a", "c"}
+    assert cache.total_bytes() <= 250
+    assert not (project / ".protext" / ".cache" / "b.md").exists()
+    assert cache.stats()["evictions"] == 1
+
+
+def test_payload_larger_than_cap_is_not_cached(tmp_path, make_project):
+    project = make_project(tmp_path / "p")
+    cache = ExtractionCache(project, max_bytes=10)
+
+    cache.put("big", "x" * 11)
+
+    assert cache.manifest["entries"] == {}
+
+
+def test_extract_counts_hits_and_honours_config_cap(tmp_path, make_project, clock):
+    project = make_project(
+        tmp_path / "p",
+        config="token_budget: 2000\nextraction_cache_bytes: 300\n",
+        extractions={"one": "docs/one.md", "two": "docs/two.md"},
+    )
+    (project / "docs").mkdir()
+    (project / "docs" / "one.md").write_text("# One\n" + "a" * 200 + "\n")
+    (project / "docs" / "two.md").write_text("# Two\n" + "b" * 200 + "\n")
+
+    assert extract(project, "one").cache == "miss"
+    assert extract(project, "one").cache == "hit"
+    assert extract(project, "two").cache == "miss"
+
+    stats = extraction.cache_stats(project)
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 1)
+    assert stats["bytes"] <= 300
+    assert extract(project, "one").cache == "miss"  # evicted by two
+
+
+def test_source_change_invalidates_entry(tmp_path, make_project):
+    project = make_project(tmp_path / "p", extractions={"one": "docs/one.md"})
+    (project / "docs").mkdir()
+    (project / "docs" / "one.md").write_text("# One\n\nold\n")
+    extract(project, "one")
+
+    (project / "docs" / "one.md").write_text("# One\n\nnew text\n")
+    result = extract(project, "one")
+
+    assert result.cache == "miss"
+    assert "new text" in result.content
+
+
+def test_eviction_removes_payloads_missing_from_manifest(tmp_path, make_project):
+    project = make_project(tmp_path / "p")
+    cache = ExtractionCache(project, max_bytes=1000)
+    cache.put("kept", "x" * 100)
+    cache.save()
+    cache_dir = project / ".protext" / ".cache"
+    (cache_dir / "manifest.json").write_text("{corrupt")
+
+    fresh = ExtractionCache(project, max_bytes=1000)
+    fresh.put("new", "y" * 100)
+
+    assert sorted(p.name for p in cache_dir.glob("*.md")) == ["new.md"]
+
+
+def test_save_leaves_no_temp_files(tmp_path, make_project):
+    project = make_project(tmp_path / "p")
+    cache = ExtractionCache(project)
+    cache.put("a", "payload")
+    cache.save()
+    cache.save()
+
+    cache_dir = project / ".protext" / ".cache"
+    assert sorted(p.name for p in cache_dir.iterdir()) == ["a.md", "manifest.json"]
@@ -0,0 +1,102 @@
+import protext
+from protext.stats import read_ledger
+from protext.layers import LayerStack, find_layers
+from protext.state import CHECK_HANDOFF_STALE, check_status
+
+
+def make_monorepo(tmp_path, make_project):
+    root = make_project(tmp_path, handoff_age_hours=72,
+                        extractions={"net": "docs/net.md", "db": "docs/db.md"},
+                        scopes=("ops", "security"),
+                        config="token_budget: 1500\nactive_scope: security\n"
+                               "features:\n  usage_ledger: true\n")
+    (root / ".git").mkdir()
+    make_project(root / "svc" / "a", tier="intermediate", handoff_age_hours=None)
+    make_project(root / "svc" / "b", extractions={"net": "docs/b-net.md"},
+                 config="active_scope: dev\nfeatures:\n  usage_ledger: false\n",
+                 scopes=("ops", "dev"))
+    return root
+
+
+def test_find_layers_walks_ancestors_only(tmp_path, make_project):
+    root = make_monorepo(tmp_path, make_project)
+    (root / "svc" / "a" / "src").mkdir()
+
+    assert find_layers(root / "svc" / "a" / "src") == [root, root / "svc" / "a"]
+    assert find_layers(root / "svc") == [root]
+
+
+def test_find_layers_stops_at_git_and_inherit_false(tmp_path, make_project):
+    make_project(tmp_path / "outer")
+    repo = make_project(tmp_path / "outer" / "repo")
+    (repo / ".git").mkdir()
+    assert find_layers(repo) == [repo]
+
+    pkg = make_project(repo / "pkg", config="inherit: false  # standalone\n")
+    assert find_layers(pkg) == [pkg]
+
+
+def test_nested_layer_inherits_handoff_and_config(tmp_path, make_project):
+    root = make_monorepo(tmp_path, make_project)
+    a = root / "svc" / "a"
+
+    state = protext.load_state(a)
+    assert state.path == a and state.tier == "intermediate"
+    assert state.handoff.status == "STALE"
+    assert (state.active_scope, state.token_budget) == ("security", 1500)
+    assert state.extractions["net"].layer == root
+
+    code, line = check_status(a, find_layers(a))
+    assert code & CHECK_HANDOFF_STALE
+    assert line.startswith("intermediate @security handoff=STALE")
+
+    status = protext.status(a)
+    assert status.code == code and status.handoff.status == "STALE"
+    assert (status.active_scope, status.scope_count) == ("security", 2)
+
+
+def test_nearest_layer_wins(tmp_path, make_project):
+    root = make_monorepo(tmp_path, make_project)
+    stack = LayerStack(root / "svc" / "b")
+
+    config = stack.config()
+    assert config["active_scope"] == "dev"
+    assert config["token_budget"] == 1500
+    assert config["features"] == {"usage_ledger": False}
+    assert stack.owner("net") == root / "svc" / "b"
+    assert stack.scopes()["ops"].parent.parent.parent == root / "svc" / "b"
+    assert set(stack.scopes()) == {"ops", "security", "dev"}
+    assert stack.handoff_path() == root / "svc" / "b" / ".protext" / "handoff.md"
+
+
+def test_load_includes_every_layer_outermost_first(tmp_path, make_project):
+    root = make_monorepo(tmp_path, make_project)
+
+    result = protext.load(root / "svc" / "a")
+
+    assert result.parts == [
+        "PROTEXT.md", "svc/a/PROTEXT.md", ".protext/handoff.md",
+        ".protext/scopes/security.md",
+    ]
+
+
+def test_root_extraction_uses_nested_config(tmp_path, make_project):
+    root = make_monorepo(tmp_path, make_project)
+    (root / "docs").mkdir()
+    (root / "docs" / "db.md").write_text("# DB\n\n" + "Replica notes. " * 200 + "\n")
+    b = root / "svc" / "b"
+    (b / ".protext" / "config.yaml").write_text(
+        "token_budget: 100\nextraction_cache_bytes: 0\n"
+        "features:\n  usage_ledger: false\n"
+    )
+
+    result = protext.extract(b, "db")
+    assert (result.budget, result.truncated, result.cache) == (100, True, "miss")
+    assert protext.extract(b, "db").cache == "miss"  # 0-byte cap: nothing kept
+
+    protext.load(b, deep=["db"])
+    assert read_ledger(root) == []
+    assert read_ledger(b) == []
+
+    assert protext.extract(root, "db").budget == 1500
+    assert [e["event"] for e in read_ledger(root)] == ["extract"]
@@ -0,0 +1,36 @@
+from protext.dedup import find_duplicates
+from protext.lint import gather_documents
+
+CAUTION = "- Never restart the primary database during business hours without approval"
+
+
+def test_gather_includes_ancestor_layers(tmp_path, make_project):
+    root = make_project(tmp_path, extractions={"net": "docs/net.md"})
+    (root / ".git").mkdir()
+    (root / "docs").mkdir()
+    (root / "docs" / "net.md").write_text("# Net\n")
+    pkg = make_project(root / "svc" / "a", tier="intermediate")
+    make_project(root / "svc" / "b", tier="beginner")
+
+    assert sorted(gather_documents(pkg)) == [
+        ".protext/scopes/ops.md", "PROTEXT.md", "docs/net.md",
+        "svc/a/.protext/handoff.md", "svc/a/PROTEXT.md",
+    ]
+
+
+def test_duplicates_between_package_and_root_are_reported(tmp_path, make_project):
+    root = make_project(tmp_path)
+    (root / ".git").mkdir()
+    pkg = make_project(root / "svc" / "a", tier="beginner")
+    (root / "PROTEXT.md").write_text(f"# Root\n\n{CAUTION}\n")
+    (pkg / "PROTEXT.md").write_text(f"# A\n\n{CAUTION}\n")
+
+    clusters = find_duplicates(gather_documents(pkg))
+
+    assert [[label for label, _ in members] for members in clusters] == [
+        ["PROTEXT.md", "svc/a/PROTEXT.md"],
+    ]
+
+
+def test_gather_uninitialized_is_empty(tmp_path):
+    assert gather_documents(tmp_path) == {}
@@ -0,0 +1,32 @@
+import pytest
+
+from protext.loader import ScopeNotFoundError, load_context
+
+
+def test_load_dedupes_scope_repeating_protext(tmp_path, make_project):
+    project = make_project(tmp_path / "p")
+    caution = "- Never restart the primary database during business hours"
+    (project / "PROTEXT.md").write_text(f"# P\n\n{caution}\n")
+    (project / ".protext" / "scopes" / "ops.md").write_text(f"# @ops\n\n{caution}\n")
+
+    result = load_context(project)
+
+    assert result.text.count(caution) == 1
+    assert result.dedup_saved > 0
+    assert load_context(project, dedup=False).text.count(caution) == 2
+
+
+def test_missing_scope_raises_scope_error(tmp_path, make_project):
+    project = make_project(tmp_path / "p")
+
+    with pytest.raises(ScopeNotFoundError) as info:
+        load_context(project, scope="nope")
+    assert info.value.scope == "nope"
+
+
+def test_missing_extraction_source_is_not_a_scope_error(tmp_path, make_project):
+    project = make_project(tmp_path / "p", extractions={"net": "docs/net.md"})
+
+    with pytest.raises(FileNotFoundError) as info:
+        load_context(project, deep=["net"])
+    assert not isinstance(info.value, ScopeNotFoundError)
@@ -0,0 +1,89 @@
+import os
+
+from protext import registry
+
+
+def bump_mtime(path, seconds=10):
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + seconds))
+
+
+def count_hashes(monkeypatch):
+    hashed = []
+    original = registry.hash_file
+
+    def counting(path):
+        hashed.append(path.name)
+        return original(path)
+
+    monkeypatch.setattr(registry, "hash_file", counting)
+    return hashed
+
+
+def test_refresh_skips_unchanged_projects(tmp_path, make_project, monkeypatch):
+    for name in ("alpha", "beta"):
+        project = make_project(tmp_path / name, extractions={"net": "docs/net.md"})
+        (project / "docs").mkdir()
+        (project / "docs" / "net.md").write_text("# Net\n")
+    hashed = count_hashes(monkeypatch)
+    conn = registry.connect(tmp_path / "registry.db")
+
+    assert registry.refresh(conn, [tmp_path]) == {"scanned": 2, "updated": 2, "removed": 0}
+    assert len(hashed) == 2
+
+    hashed.clear()
+    assert registry.refresh(conn) == {"scanned": 2, "updated": 0, "removed": 0}
+    assert hashed == []
+
+
+def test_refresh_rehashes_only_changed_sources(tmp_path, make_project, monkeypatch):
+    project = make_project(tmp_path / "alpha",
+                           extractions={"net": "docs/net.md", "db": "docs/db.md"})
+    (project / "docs").mkdir()
+    (project / "docs" / "net.md").write_text("# Net\n")
+    (project / "docs" / "db.md").write_text("# DB\n")
+    conn = registry.connect(tmp_path / "registry.db")
+    registry.refresh(conn, [tmp_path])
+    hashed = count_hashes(monkeypatch)
+
+    (project / "docs" / "net.md").write_text("# Net\n\nChanged.\n")
+    bump_mtime(project / "docs" / "net.md")
+
+    assert registry.refresh(conn)["updated"] == 1
+    assert hashed == ["net.md"]
+
+
+def test_query_filters_on_live_handoff_status(tmp_path, make_project):
+    make_project(tmp_path / "fresh", handoff_age_hours=1)
+    make_project(tmp_path / "stale", handoff_age_hours=72, scopes=("security",),
+                 config="token_budget: 2000\nactive_scope: security\n",
+                 handoff_status="FRESH")
+    conn = registry.connect(tmp_path / "registry.db")
+    registry.refresh(conn, [tmp_path])
+
+    rows = registry.query(conn, status="STALE", scope="@security")
+    assert [row["name"] for row in rows] == ["stale"]
+    assert rows[0]["handoff_explicit"] == "FRESH"
+    assert not conn.in_transaction
+
+
+def test_query_uses_project_handoff_ttl(tmp_path, make_project):
+    make_project(tmp_path / "short", handoff_age_hours=30, handoff_status="FRESH",
+                 config="token_budget: 2000\nhandoff_ttl_hours: 24\n")
+    make_project(tmp_path / "default", handoff_age_hours=30, handoff_status="FRESH")
+    conn = registry.connect(tmp_path / "registry.db")
+    registry.refresh(conn, [tmp_path])
+
+    statuses = {row["name"]: row["handoff_status"] for row in registry.query(conn)}
+    assert statuses == {"short": "STALE", "default": "AGING"}
+
+
+def test_refresh_removes_deleted_projects(tmp_path, make_project):
+    project = make_project(tmp_path / "gone")
+    conn = registry.connect(tmp_path / "registry.db")
+    registry.refresh(conn, [tmp_path])
+
+    (project / "PROTEXT.md").unlink()
+
+    assert registry.refresh(conn)["removed"] == 1
+    assert registry.query(conn) == []
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from protext.state import (
+    CHECK_BUDGET_EXCEEDED,
+    CHECK_HANDOFF_STALE,
+    CHECK_NOT_INITIALIZED,
+    CHECK_OK,
+    check_status,
+    classify_handoff,
+)
+
+
+def test_check_not_initialized(tmp_path):
+    assert check_status(tmp_path) == (CHECK_NOT_INITIALIZED, "none")
+
+
+def test_check_ok(tmp_path, make_project):
+    project = make_project(tmp_path / "p", handoff_status="FRESH")
+
+    code, line = check_status(project)
+
+    assert code == CHECK_OK
+    assert line.startswith("advanced @ops handoff=FRESH tokens=")
+
+
+def test_check_old_handoff_is_stale_despite_explicit_fresh(tmp_path, make_project):
+    project = make_project(tmp_path / "p", handoff_age_hours=24 * 30,
+                           handoff_status="FRESH")
+
+    code, line = check_status(project)
+
+    assert code == CHECK_HANDOFF_STALE
+    assert "handoff=STALE" in line
+
+
+def test_check_uses_configured_ttl(tmp_path, make_project):
+    project = make_project(tmp_path / "p", handoff_age_hours=13, handoff_status="FRESH",
+                           config="token_budget: 2000\nhandoff_ttl_hours: 12\n")
+
+    assert check_status(project)[0] == CHECK_HANDOFF_STALE
+
+
+def test_check_over_budget_combines_with_stale(tmp_path, make_project):
+    project = make_project(tmp_path / "p", handoff_age_hours=72,
+                           config="token_budget: 10  # tiny\n")
+    (project / "PROTEXT.md").write_text("x" * 400)
+
+    code, line = check_status(project)
+
+    assert code == CHECK_HANDOFF_STALE | CHECK_BUDGET_EXCEEDED
+    assert line.endswith("tokens=100/10")
+
+
+@pytest.mark.parametrize("age, explicit, expected", [
+    (1, "FRESH", "FRESH"),
+    (1, "STALE", "STALE"),
+    (30, "FRESH", "AGING"),
+    (72, "AGING", "STALE"),
+    (None, "AGING", "AGING"),
+])
+def test_classify_handoff_takes_worse_status(age, explicit, expected):
+    updated = ""
+    if age is not None:
+        updated = f"Updated: {(datetime.now() - timedelta(hours=age)):%Y-%m-%dT%H:%M} | "
+    header = f"# Session Handoff\n> {updated}Status: {explicit}\n"
+
+    assert classify_handoff(header)["status"] == expected
@@ -0,0 +1,77 @@
+from protext.loader import load_context
+from protext.stats import read_ledger, record_event, summarize, tune
+
+
+def make_extracting_project(tmp_path, make_project):
+    project = make_project(tmp_path / "p", extractions={"net": "docs/net.md"})
+    (project / "docs").mkdir()
+    (project / "docs" / "net.md").write_text("# Net\n\n" + "DNS notes. " * 40 + "\n")
+    return project
+
+
+def test_load_tokens_not_double_counted(tmp_path, make_project, monkeypatch):
+    project = make_extracting_project(tmp_path, make_project)
+    monkeypatch.setenv("PROTEXT_SESSION", "s1")
+
+    result = load_context(project, deep=["net"])
+
+    assert [e["event"] for e in read_ledger(project)] == ["extract", "load"]
+    summary = summarize(project)
+    assert summary["sessions"]["s1"]["tokens"] == result.tokens
+    assert summary["extractions"]["net"]["tokens"] > 0
+
+
+def test_standalone_extract_counts_toward_session(tmp_path, make_project, monkeypatch):
+    project = make_extracting_project(tmp_path, make_project)
+    monkeypatch.setenv("PROTEXT_SESSION", "s1")
+    record_event(project, "extract", "net", 50)
+    record_event(project, "load", tokens=200)
+
+    assert summarize(project)["sessions"]["s1"]["tokens"] == 250
+
+
+def test_unrated_extraction_is_not_never_used(tmp_path, make_project):
+    project = make_extracting_project(tmp_path, make_project)
+    for _ in range(3):
+        record_event(project, "extract", "net", 10)
+
+    summary = summarize(project)
+    assert summary["never_used"] == []
+    assert summary["extractions"]["net"]["use_rate"] is None
+
+    record_event(project, "unused", "net")
+    assert summarize(project)["never_used"] == ["net"]
+
+
+def record_sessions(project, monkeypatch, load_tokens):
+    for i, tokens in enumerate(load_tokens):
+        monkeypatch.setenv("PROTEXT_SESSION", f"s{i}")
+        record_event(project, "load", tokens=tokens)
+        record_event(project, "extract", "net", 40, in_load=True)
+
+
+def test_tune_recommends_budget_from_sessions(tmp_path, make_project, monkeypatch):
+    project = make_extracting_project(tmp_path, make_project)
+    record_sessions(project, monkeypatch, [900, 1150, 1000, 950, 1100])
+
+    assert "token_budget: 1200 covers 90% of 5 recorded sessions (currently 2000)" \
+        in tune(summarize(project))
+
+
+def test_tune_needs_enough_load_sessions(tmp_path, make_project, monkeypatch):
+    project = make_extracting_project(tmp_path, make_project)
+    record_sessions(project, monkeypatch, [900, 1000, 1100, 950])
+    for i in range(5):
+        monkeypatch.setenv("PROTEXT_SESSION", f"extract-only-{i}")
+        record_event(project, "extract", "net", 20)
+
+    assert not any(r.startswith("token_budget") for r in tune(summarize(project)))
+
+
+def test_tune_budget_never_below_protext_md(tmp_path, make_project, monkeypatch):
+    project = make_extracting_project(tmp_path, make_project)
+    (project / "PROTEXT.md").write_text("x" * 1000)  # ~250 tokens
+    record_sessions(project, monkeypatch, [60, 80, 70, 90, 50])
+
+    assert "token_budget: 300 covers 90% of 5 recorded sessions (currently 2000)" \
+        in tune(summarize(project))